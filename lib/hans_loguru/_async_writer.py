@@ -0,0 +1,128 @@
+"""单进程 asyncio 日志写入模块.
+
+不需要监听进程的单进程程序可以直接在事件循环中写日志文件：
+loguru 的 sink 只把格式化后的日志放入 ``asyncio.Queue``，
+由后台写入任务一次取出一批，合并后一次写入文件，并定期 fsync。
+
+安装了 `aiofile <https://pypi.org/project/aiofile/>`_ 时使用其异步文件接口，
+否则通过 ``asyncio.to_thread`` 在线程池中调用 ``os.write``。
+"""
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+try:
+    from aiofile import async_open
+except ImportError:
+    async_open = None
+
+
+class AsyncFileSink:
+    """运行在事件循环中的批量日志文件写入器.
+
+    必须在事件循环内创建；:meth:`write` 可以在任意线程中调用。
+    """
+
+    def __init__(self, file_path: str, encoding: str = "utf-8", batch_size: int = 256,
+                 fsync_interval: Optional[float] = 1.0):
+        """初始化写入器并启动后台写入任务.
+
+        :param file_path: 日志文件路径
+        :type file_path: str
+        :param encoding: 文件编码
+        :type encoding: str
+        :param batch_size: 单次写入的最大日志条数
+        :type batch_size: int
+        :param fsync_interval: 两次 fsync 之间的最短间隔（秒），None 表示不主动 fsync
+        :type fsync_interval: Optional[float]
+        :raises RuntimeError: 当前线程没有正在运行的事件循环
+        """
+        self.file_path = file_path
+        self._encoding = encoding
+        self._batch_size = batch_size
+        self._fsync_interval = fsync_interval
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._task = self._loop.create_task(self._run())
+
+    def write(self, message: str) -> None:
+        """loguru sink：将格式化后的日志放入写入队列.
+
+        :param message: 格式化后的日志文本
+        :type message: str
+        """
+        data = message.encode(self._encoding)
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._queue.put_nowait(data)
+        else:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, data)
+
+    async def _next_batch(self) -> list:
+        """等待并取出一批日志，最后一项为 None 表示收到停止信号.
+
+        :return: 已编码的日志列表
+        :rtype: list
+        """
+        batch = [await self._queue.get()]
+        while batch[-1] is not None and len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """后台写入任务."""
+        if async_open is not None:
+            async with async_open(self.file_path, "ab") as afp:
+                await self._write_loop(afp.write, afp.file.fsync)
+            return
+
+        fd = await asyncio.to_thread(
+            os.open, self.file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o644
+        )
+        try:
+            await self._write_loop(
+                lambda data: asyncio.to_thread(_write_all, fd, data),
+                lambda: asyncio.to_thread(os.fsync, fd)
+            )
+        finally:
+            os.close(fd)
+
+    async def _write_loop(self, write, fsync) -> None:
+        """循环取出日志批量写入，直到收到停止信号.
+
+        :param write: 异步写入函数
+        :param fsync: 异步 fsync 函数
+        """
+        last_fsync = time.monotonic()
+        running = True
+        while running:
+            batch = await self._next_batch()
+            if batch[-1] is None:
+                batch.pop()
+                running = False
+            if batch:
+                await write(b"".join(batch))
+            now = time.monotonic()
+            if self._fsync_interval is not None and (not running or now - last_fsync >= self._fsync_interval):
+                await fsync()
+                last_fsync = now
+
+    async def stop(self) -> None:
+        """写出队列中剩余的日志并关闭文件."""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+        await self._task
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """循环写入直到数据全部写完."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
@@ -0,0 +1,315 @@
+"""日志格式预编译模块.
+
+将 loguru 风格的格式字符串（如 ``"{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {message}"``）
+在配置阶段一次性解析，并通过代码生成得到专用的格式化函数，
+监听进程写文件时直接调用，无需每条日志都经过 loguru 的格式解析和颜色处理。
+
+只支持监听进程能从 :class:`LogRecord` 中取得的字段，遇到不支持的字段、时间标记或颜色标记时
+抛出 :class:`ValueError`，调用方应回退到 loguru 自身的 sink。
+"""
+
+import re
+import string
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+# loguru 颜色标记，如 <green>、</green>、<level>、</>、<fg #ff0000>
+_MARKUP_RE = re.compile(r"(?<!\\)</?(?:[fb]g\s)?[^<>\s]*>")
+
+# loguru 颜色标记到 ANSI 转义码的映射，大写为背景色
+_ANSI_CODES = {
+    "black": 30, "red": 31, "green": 32, "yellow": 33,
+    "blue": 34, "magenta": 35, "cyan": 36, "white": 37,
+    "light-black": 90, "light-red": 91, "light-green": 92, "light-yellow": 93,
+    "light-blue": 94, "light-magenta": 95, "light-cyan": 96, "light-white": 97,
+    "BLACK": 40, "RED": 41, "GREEN": 42, "YELLOW": 43,
+    "BLUE": 44, "MAGENTA": 45, "CYAN": 46, "WHITE": 47,
+    "LIGHT-BLACK": 100, "LIGHT-RED": 101, "LIGHT-GREEN": 102, "LIGHT-YELLOW": 103,
+    "LIGHT-BLUE": 104, "LIGHT-MAGENTA": 105, "LIGHT-CYAN": 106, "LIGHT-WHITE": 107,
+    "bold": 1, "b": 1, "dim": 2, "d": 2, "normal": 22, "n": 22,
+    "italic": 3, "i": 3, "underline": 4, "u": 4, "strike": 9, "s": 9,
+    "reverse": 7, "r": 7, "blink": 5, "l": 5, "hide": 8, "h": 8,
+}
+
+_ANSI_RESET = "\033[0m"
+
+# loguru 时间标记，长的标记必须排在前面
+_TIME_TOKEN_RE = re.compile(
+    r"\[(?P<escaped>[^\]]*)\]"
+    r"|(?P<token>YYYY|YY|Q|MMMM|MMM|MM|M|DDDD|DDD|DD|Do|D|dddd|ddd|d|E|"
+    r"HH|H|hh|h|mm|m|ss|s|S{1,9}|X|x|ZZ|Z|zz|A)"
+)
+
+# loguru 时间标记到 strftime 的映射
+_STRFTIME_TOKENS = {
+    "YYYY": "%Y",
+    "YY": "%y",
+    "MMMM": "%B",
+    "MMM": "%b",
+    "MM": "%m",
+    "DD": "%d",
+    "dddd": "%A",
+    "ddd": "%a",
+    "HH": "%H",
+    "hh": "%I",
+    "mm": "%M",
+    "ss": "%S",
+    "A": "%p",
+    "ZZ": "%z",
+}
+
+# loguru 默认的时间格式
+_DEFAULT_TIME_FORMAT = "YYYY-MM-DDTHH:mm:ss.SSSSSSZ"
+
+# 字段名到 LogRecord 属性表达式的映射
+_FIELDS = {
+    "message": "r.message",
+    "level": "r.level",
+    "level.name": "r.level",
+    "level.no": "_level_no(r.level)",
+    "file": "r.file",
+    "file.name": "r.file",
+    "name": "r.name",
+    "module": "r.file.rpartition('.')[0]",
+    "function": "r.function",
+    "line": "r.line",
+    "process": "r.process",
+    "process.id": "r.process",
+    "thread": "r.thread",
+    "thread.id": "r.thread",
+    "exception": "(r.exception or '')",
+    "extra[process]": "r.process",
+    "extra[thread]": "r.thread",
+    "extra[file]": "r.file",
+    "extra[line]": "r.line",
+    "extra[function]": "r.function",
+    "extra[name]": "r.name",
+}
+
+
+def strip_markup(fmt: str) -> str:
+    """去除格式字符串中的 loguru 颜色标记.
+
+    :param fmt: loguru 格式字符串
+    :type fmt: str
+    :return: 去除颜色标记后的格式字符串
+    :rtype: str
+    """
+    return _MARKUP_RE.sub("", fmt).replace("\\<", "<")
+
+
+def markup_to_ansi(markup: str) -> str:
+    """将只包含开始标记的 loguru 颜色标记（如级别颜色 ``"<red><bold>"``）转换为 ANSI 转义码.
+
+    :param markup: loguru 颜色标记
+    :type markup: str
+    :return: ANSI 转义码
+    :rtype: str
+    :raises ValueError: 包含不支持的颜色标记
+    """
+    ansi = []
+    for tag in _MARKUP_RE.findall(markup):
+        name = tag[1:-1]
+        if name not in _ANSI_CODES:
+            raise ValueError(f"不支持的颜色标记: {tag}")
+        ansi.append(f"\033[{_ANSI_CODES[name]}m")
+    return "".join(ansi)
+
+
+def _parse_time_segments(spec: str) -> list:
+    """将 loguru 时间格式解析为片段列表.
+
+    片段类型: ``("strftime", 模板)`` / ``("fraction", 位数)`` / ``("offset", None)``。
+
+    :param spec: loguru 时间格式
+    :type spec: str
+    :return: 片段列表
+    :rtype: list
+    :raises ValueError: 包含不支持的时间标记
+    """
+    spec = spec or _DEFAULT_TIME_FORMAT
+    segments = []
+
+    def add_strftime(pattern: str):
+        if segments and segments[-1][0] == "strftime":
+            segments[-1] = ("strftime", segments[-1][1] + pattern)
+        else:
+            segments.append(("strftime", pattern))
+
+    pos = 0
+    for match in _TIME_TOKEN_RE.finditer(spec):
+        add_strftime(spec[pos:match.start()].replace("%", "%%"))
+        pos = match.end()
+        token = match.group("token")
+        if token is None:
+            add_strftime(match.group("escaped").replace("%", "%%"))
+        elif token in _STRFTIME_TOKENS:
+            add_strftime(_STRFTIME_TOKENS[token])
+        elif token.startswith("S"):
+            segments.append(("fraction", len(token)))
+        elif token == "Z":
+            segments.append(("offset", None))
+        else:
+            raise ValueError(f"不支持的时间标记: {token}")
+    add_strftime(spec[pos:].replace("%", "%%"))
+    return segments
+
+
+def _format_second(dt: datetime, segments: list) -> list:
+    """格式化时间中与秒以下部分无关的片段，毫秒等片段保留为位数."""
+    parts = []
+    for kind, value in segments:
+        if kind == "strftime":
+            parts.append(dt.strftime(value))
+        elif kind == "fraction":
+            parts.append(value)
+        else:
+            offset = dt.strftime("%z")
+            parts.append(f"{offset[:3]}:{offset[3:5]}" if offset else "")
+    return parts
+
+
+def compile_time_format(spec: str) -> Callable[[int], str]:
+    """将 loguru 时间格式编译为纳秒时间戳的格式化函数.
+
+    时间按本地时区格式化。秒及以上的部分只在秒数变化时重新格式化一次，
+    同一秒内的日志只拼接秒以下部分，避免每条日志都构造 datetime 和调用 strftime。
+
+    :param spec: loguru 时间格式，如 ``"YYYY-MM-DD HH:mm:ss.SSS"``
+    :type spec: str
+    :return: 接收 Unix 时间戳（纳秒）返回格式化结果的函数
+    :rtype: Callable[[int], str]
+    :raises ValueError: 包含不支持的时间标记
+    """
+    segments = _parse_time_segments(spec)
+    has_fraction = any(kind == "fraction" for kind, _ in segments)
+    cache = {"second": None, "parts": None, "text": None}
+
+    def format_time(time_ns: int) -> str:
+        second, fraction = divmod(time_ns, 1_000_000_000)
+        if second != cache["second"]:
+            parts = _format_second(datetime.fromtimestamp(second, timezone.utc).astimezone(), segments)
+            cache["second"], cache["parts"] = second, parts
+            cache["text"] = None if has_fraction else "".join(parts)
+        if not has_fraction:
+            return cache["text"]
+        digits = f"{fraction:09d}"
+        return "".join(part if isinstance(part, str) else digits[:part] for part in cache["parts"])
+
+    return format_time
+
+
+def time_ns_to_iso(time_ns: int) -> str:
+    """将纳秒时间戳转换为带本地时区的 ISO 8601 字符串（精确到微秒）.
+
+    :param time_ns: Unix 时间戳（纳秒）
+    :type time_ns: int
+    :return: ISO 8601 时间字符串
+    :rtype: str
+    """
+    second, fraction = divmod(time_ns, 1_000_000_000)
+    return datetime.fromtimestamp(second, timezone.utc).replace(microsecond=fraction // 1000).astimezone().isoformat()
+
+
+def _compile_fields(fmt: str, namespace: dict, exprs: List[str]) -> None:
+    """将不含颜色标记的格式字符串解析为表达式，追加到 ``exprs``.
+
+    :param fmt: 不含颜色标记的格式字符串
+    :type fmt: str
+    :param namespace: 生成函数的全局命名空间，时间格式化函数会注册到其中
+    :type namespace: dict
+    :param exprs: 表达式列表
+    :type exprs: List[str]
+    :raises ValueError: 包含不支持的字段
+    """
+    for literal, field, spec, conversion in string.Formatter().parse(fmt):
+        if literal:
+            exprs.append(repr(literal))
+        if field is None:
+            continue
+
+        if field in ("time", "extra[time]"):
+            name = f"_time_{len(exprs)}"
+            namespace[name] = compile_time_format(spec)
+            exprs.append(f"{name}(r.time)")
+            continue
+        if field not in _FIELDS:
+            raise ValueError(f"不支持的日志格式字段: {field}")
+
+        expr = _FIELDS[field]
+        if conversion == "r":
+            expr = f"repr({expr})"
+        elif conversion == "s":
+            expr = f"str({expr})"
+        elif conversion == "a":
+            expr = f"ascii({expr})"
+        exprs.append(f"format({expr}, {spec!r})" if spec else f"str({expr})")
+
+
+def _references_exception(fmt: str) -> bool:
+    """判断格式字符串是否已经引用了 ``{exception}`` 字段.
+
+    :param fmt: loguru 格式字符串
+    :type fmt: str
+    :return: 是否引用了异常字段
+    :rtype: bool
+    """
+    return any(field == "exception" for _, field, _, _ in string.Formatter().parse(strip_markup(fmt)))
+
+
+def compile_format(fmt: str, level_no: Callable[[str], int],
+                   level_ansi: Optional[Callable[[str], str]] = None) -> Callable:
+    """将 loguru 格式字符串编译为 LogRecord 格式化函数.
+
+    与 loguru 一致，会在格式末尾追加 ``"\\n{exception}"``；格式中已引用 ``{exception}`` 时不再追加，
+    避免异常堆栈重复输出。
+    未提供 ``level_ansi`` 时去除颜色标记；提供时按 loguru 的规则将颜色标记转换为 ANSI 转义码：
+    结束标记先重置样式，再重新应用仍未结束的标记。
+
+    :param fmt: loguru 格式字符串
+    :type fmt: str
+    :param level_no: 由日志级别名称获取级别编号的函数
+    :type level_no: Callable[[str], int]
+    :param level_ansi: 由日志级别名称获取 ``<level>`` 对应 ANSI 转义码的函数
+    :type level_ansi: Optional[Callable[[str], str]]
+    :return: 接收 LogRecord 返回格式化文本的函数
+    :rtype: Callable
+    :raises ValueError: 包含不支持的字段或颜色标记
+    """
+    namespace = {"_level_no": level_no, "_level_ansi": level_ansi}
+    exprs: List[str] = []
+
+    if level_ansi is None:
+        _compile_fields(strip_markup(fmt), namespace, exprs)
+    else:
+        # 仍未结束的标记对应的表达式
+        opened: List[str] = []
+        pos = 0
+        for match in _MARKUP_RE.finditer(fmt):
+            _compile_fields(fmt[pos:match.start()].replace("\\<", "<"), namespace, exprs)
+            pos = match.end()
+            tag = match.group()
+            if tag.startswith("</"):
+                if not opened:
+                    raise ValueError(f"多余的结束标记: {tag}")
+                opened.pop()
+                exprs.append(repr(_ANSI_RESET))
+                exprs.extend(opened)
+                continue
+            name = tag[1:-1]
+            if name == "level":
+                opened.append("_level_ansi(r.level)")
+            elif name in _ANSI_CODES:
+                opened.append(repr(f"\033[{_ANSI_CODES[name]}m"))
+            else:
+                raise ValueError(f"不支持的颜色标记: {tag}")
+            exprs.append(opened[-1])
+        if opened:
+            raise ValueError("颜色标记未结束")
+        _compile_fields(fmt[pos:].replace("\\<", "<"), namespace, exprs)
+
+    if not _references_exception(fmt):
+        _compile_fields("\n{exception}", namespace, exprs)
+    source = f"def _format(r):\n    return ''.join(({', '.join(exprs)},))\n"
+    exec(compile(source, f"<hans_loguru format {fmt!r}>", "exec"), namespace)
+    return namespace["_format"]
@@ -5,6 +5,7 @@
     - 支持配置多个日志文件，每个文件可设置不同的日志级别
     - 支持独立设置终端输出的日志级别
     - 支持日志轮转、保留期限和压缩功能
+    - 基于共享内存环形缓冲区传递日志记录，监听进程按批次读取
 
 使用示例::
 
@@ -34,15 +35,236 @@
 """
 
 from loguru import logger
+import logging
+import logging.handlers
 import multiprocessing
+import multiprocessing.util
 import threading
 import datetime
 import time
 import sys
 import pickle
 import os
-from multiprocessing import freeze_support
-from typing import List, Optional
+import queue
+import re
+import struct
+import traceback
+import weakref
+import contextlib
+import copy
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from multiprocessing import freeze_support, shared_memory
+from typing import List, NamedTuple, Optional
+
+from ._formatter import compile_format, markup_to_ansi, time_ns_to_iso
+from ._iouring_writer import create_submitter
+from ._async_writer import AsyncFileSink
+
+# msgspec 为可选依赖，未安装时回退到 struct 定长头编码
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# faster_fifo 为可选依赖，未安装时使用 SharedRingQueue
+try:
+    import faster_fifo
+except ImportError:
+    faster_fifo = None
+
+# 当前进程ID，只在导入和 fork 后获取一次，避免每条日志都调用 os.getpid()
+_pid = os.getpid()
+
+
+def _refresh_pid():
+    """fork 后在子进程中刷新缓存的进程ID."""
+    global _pid
+    _pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+
+@lru_cache(maxsize=None)
+def _level_no(level_name: str) -> int:
+    """获取日志级别名称对应的级别编号（带缓存）.
+
+    :param level_name: 日志级别名称
+    :type level_name: str
+    :return: 日志级别编号
+    :rtype: int
+    """
+    return logger.level(level_name).no
+
+
+@lru_cache(maxsize=None)
+def _level_ansi(level_name: str) -> str:
+    """获取日志级别颜色对应的 ANSI 转义码（带缓存）.
+
+    :param level_name: 日志级别名称
+    :type level_name: str
+    :return: ANSI 转义码，颜色标记无法转换时为空字符串
+    :rtype: str
+    """
+    try:
+        return markup_to_ansi(logger.level(level_name).color)
+    except ValueError:
+        return ""
+
+
+# DEBUG 级别编号，用于 HansLoguru.dbg 的快速判断
+_DEBUG_NO = 10
+# 低于该级别的日志只附带一行异常摘要，不格式化完整堆栈
+_WARNING_NO = 30
+# 已格式化的异常堆栈缓存，异常对象被回收后自动失效
+_traceback_cache = weakref.WeakKeyDictionary()
+
+
+def _format_exception(exc_type, exc_value, exc_tb, full: bool = True) -> str:
+    """格式化异常信息.
+
+    完整堆栈按异常对象缓存，同一个异常被多次记录时只格式化一次。
+
+    :param exc_type: 异常类型
+    :param exc_value: 异常对象
+    :param exc_tb: 异常堆栈
+    :param full: 是否格式化完整堆栈，否则只返回一行异常摘要
+    :type full: bool
+    :return: 格式化后的异常信息
+    :rtype: str
+    """
+    if not full:
+        return "".join(traceback.format_exception_only(exc_type, exc_value))
+
+    try:
+        cached = _traceback_cache.get(exc_value)
+    except TypeError:
+        # 异常对象不支持弱引用时不缓存
+        cached = None
+    if cached is not None and cached[0] is exc_tb:
+        return cached[1]
+
+    text = "".join(
+        traceback.TracebackException(exc_type, exc_value, exc_tb, capture_locals=False, compact=True).format()
+    )
+    try:
+        _traceback_cache[exc_value] = (exc_tb, text)
+    except TypeError:
+        pass
+    return text
+
+
+if msgspec is not None:
+    class LogRecord(msgspec.Struct, array_like=True, gc=False):
+        """跨进程传递的日志记录.
+
+        ``array_like=True`` 时按字段顺序编码为 msgpack 数组，不传输字段名。
+        """
+
+        message: str
+        level: str
+        process: int
+        thread: int
+        time: int  # Unix 时间戳（纳秒）
+        file: str
+        line: int
+        function: str
+        name: str
+        exception: Optional[str] = None
+
+    _record_encoder = msgspec.msgpack.Encoder()
+    _record_decoder = msgspec.msgpack.Decoder(Optional[LogRecord])
+
+    def encode_record(record: Optional["LogRecord"]) -> bytes:
+        """将日志记录编码为字节串，None 表示终止信号.
+
+        :param record: 日志记录
+        :type record: Optional[LogRecord]
+        :return: 编码后的字节串
+        :rtype: bytes
+        """
+        return _record_encoder.encode(record)
+
+    def decode_record(data: bytes) -> Optional["LogRecord"]:
+        """将字节串解码为日志记录.
+
+        :param data: 编码后的字节串
+        :type data: bytes
+        :return: 日志记录，终止信号返回 None
+        :rtype: Optional[LogRecord]
+        """
+        return _record_decoder.decode(data)
+else:
+    class LogRecord(NamedTuple):
+        """跨进程传递的日志记录（未安装 msgspec 时的回退实现）."""
+
+        message: str
+        level: str
+        process: int
+        thread: int
+        time: int  # Unix 时间戳（纳秒）
+        file: str
+        line: int
+        function: str
+        name: str
+        exception: Optional[str] = None
+
+    # 定长记录头: 进程ID、线程ID、行号、纳秒时间戳，以及 message/level/file/function/name/exception 的字节长度
+    _RECORD_HEADER = struct.Struct("<IQIq6I")
+    # exception 为 None 时使用的长度标记
+    _NO_EXCEPTION = 0xFFFFFFFF
+
+    def encode_record(record: Optional["LogRecord"]) -> bytes:
+        """将日志记录编码为定长头 + 变长 UTF-8 字段的字节串，None 表示终止信号.
+
+        :param record: 日志记录
+        :type record: Optional[LogRecord]
+        :return: 编码后的字节串，终止信号为空字节串
+        :rtype: bytes
+        """
+        if record is None:
+            return b""
+        message = record.message.encode("utf-8", "surrogatepass")
+        level = record.level.encode("utf-8")
+        file = record.file.encode("utf-8", "surrogatepass")
+        function = record.function.encode("utf-8", "surrogatepass")
+        name = record.name.encode("utf-8", "surrogatepass")
+        if record.exception is None:
+            exception, exception_len = b"", _NO_EXCEPTION
+        else:
+            exception = record.exception.encode("utf-8", "surrogatepass")
+            exception_len = len(exception)
+        header = _RECORD_HEADER.pack(
+            record.process, record.thread, record.line, record.time,
+            len(message), len(level), len(file), len(function), len(name), exception_len
+        )
+        return b"".join((header, message, level, file, function, name, exception))
+
+    def decode_record(data: bytes) -> Optional["LogRecord"]:
+        """将字节串解码为日志记录.
+
+        :param data: 编码后的字节串
+        :type data: bytes
+        :return: 日志记录，终止信号返回 None
+        :rtype: Optional[LogRecord]
+        """
+        if not data:
+            return None
+        process, thread, line, time_ns, *lengths = _RECORD_HEADER.unpack_from(data)
+        exception_len = lengths.pop()
+        view = memoryview(data)
+        pos = _RECORD_HEADER.size
+        values = []
+        for length in lengths:
+            end = pos + length
+            values.append(str(view[pos:end], "utf-8", "surrogatepass"))
+            pos = end
+        message, level, file, function, name = values
+        exception = None if exception_len == _NO_EXCEPTION else str(view[pos:], "utf-8", "surrogatepass")
+        return LogRecord(message, level, process, thread, time_ns, file, line, function, name, exception)
+
 
 class ConsoleConfig:
     """控制台日志配置类.
@@ -75,6 +297,8 @@ class LogFileConfig:
     用于配置单个日志文件的参数。
     """
 
+    __slots__ = ("file_path", "level", "rotation", "retention", "compression", "format")
+
     def __init__(self, file_path: str, level: str = "TRACE", rotation: Optional[str] = None,
                  retention: Optional[str] = None, compression: Optional[str] = None,
                  format: Optional[str] = None):
@@ -100,6 +324,987 @@ class LogFileConfig:
         self.compression = compression
         self.format = format
 
+class LogQueueBase(ABC):
+    """日志传输队列基类.
+
+    定义监听进程和工作进程共用的接口：子类只需实现 :meth:`put_bytes` 和
+    :meth:`drain_batch_bytes`，并在序列化时通过 :meth:`_base_state` 传递共享状态。
+    """
+
+    def __init__(self):
+        """初始化队列共享状态."""
+        self._min_level = multiprocessing.RawValue("i", 0)
+        self._listener_cpu = multiprocessing.RawValue("i", -1)
+        self._dropped = multiprocessing.Value("L", 0)
+        self._pending = []
+
+    def _base_state(self) -> dict:
+        """返回需要传递给子进程的共享状态."""
+        return {"min_level": self._min_level, "listener_cpu": self._listener_cpu, "dropped": self._dropped}
+
+    def _restore_base_state(self, state: dict) -> None:
+        """在子进程中恢复共享状态."""
+        self._min_level = state["min_level"]
+        self._listener_cpu = state["listener_cpu"]
+        self._dropped = state["dropped"]
+        self._pending = []
+
+    @property
+    def min_level_no(self) -> int:
+        """监听进程实际会输出的最低日志级别编号，由监听进程启动时设置.
+
+        :return: 日志级别编号
+        :rtype: int
+        """
+        return self._min_level.value
+
+    @min_level_no.setter
+    def min_level_no(self, value: int) -> None:
+        self._min_level.value = value
+
+    @property
+    def listener_cpu(self) -> int:
+        """监听进程绑定的 CPU 编号，-1 表示未绑定.
+
+        :return: CPU 编号
+        :rtype: int
+        """
+        return self._listener_cpu.value
+
+    @listener_cpu.setter
+    def listener_cpu(self, value: int) -> None:
+        self._listener_cpu.value = value
+
+    def offer_bytes(self, data: bytes) -> bool:
+        """不等待地写入一条已序列化的记录，队列已满时丢弃并计数.
+
+        :param data: 序列化后的记录
+        :type data: bytes
+        :return: 是否写入成功
+        :rtype: bool
+        """
+        try:
+            self.put_bytes(data, block=False)
+            return True
+        except queue.Full:
+            self._count_dropped(1)
+            return False
+
+    def offer_many_bytes(self, items: List[bytes]) -> int:
+        """不等待地写入多条已序列化的记录，放不下的记录丢弃并计数.
+
+        :param items: 序列化后的记录列表
+        :type items: List[bytes]
+        :return: 写入成功的记录数
+        :rtype: int
+        """
+        return sum(self.offer_bytes(data) for data in items)
+
+    def _count_dropped(self, count: int) -> None:
+        """累加丢弃的记录数.
+
+        :param count: 丢弃的记录数
+        :type count: int
+        """
+        with self._dropped.get_lock():
+            self._dropped.value += count
+
+    def take_dropped(self) -> int:
+        """取出自上次调用以来因队列已满而丢弃的记录数，并将计数清零.
+
+        :return: 丢弃的记录数
+        :rtype: int
+        """
+        with self._dropped.get_lock():
+            dropped = self._dropped.value
+            self._dropped.value = 0
+        return dropped
+
+    def open(self) -> "LogQueueBase":
+        """准备队列，必须在启动任何子进程之前调用.
+
+        :return: 队列自身
+        :rtype: LogQueueBase
+        """
+        return self
+
+    def close(self) -> None:
+        """关闭队列."""
+
+    @abstractmethod
+    def put_bytes(self, data: bytes, block: bool = True, timeout: Optional[float] = None) -> None:
+        """写入一条已序列化的记录.
+
+        :param data: 序列化后的记录
+        :type data: bytes
+        :param block: 队列已满时是否等待
+        :type block: bool
+        :param timeout: 等待超时时间（秒），None 表示一直等待
+        :type timeout: Optional[float]
+        :raises queue.Full: 队列已满且不等待或等待超时
+        """
+
+    @abstractmethod
+    def drain_batch_bytes(self, max_items: int = 256, timeout: Optional[float] = None) -> List[bytes]:
+        """取出一批原始记录，队列为空时等待.
+
+        :param max_items: 单批最多取出的记录数
+        :type max_items: int
+        :param timeout: 等待超时时间（秒），None 表示一直等待
+        :type timeout: Optional[float]
+        :return: 原始记录列表，超时返回空列表
+        :rtype: List[bytes]
+        """
+
+    def put(self, obj, block: bool = True, timeout: Optional[float] = None) -> None:
+        """序列化并写入一条记录.
+
+        :param obj: 任意可 pickle 的对象
+        :param block: 队列已满时是否等待
+        :type block: bool
+        :param timeout: 等待超时时间（秒）
+        :type timeout: Optional[float]
+        """
+        self.put_bytes(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), block, timeout)
+
+    def put_nowait(self, obj) -> None:
+        """非阻塞写入一条记录."""
+        self.put(obj, block=False)
+
+    def drain_batch(self, max_items: int = 256, timeout: Optional[float] = None) -> list:
+        """取出一批记录并反序列化.
+
+        :param max_items: 单批最多取出的记录数
+        :type max_items: int
+        :param timeout: 等待超时时间（秒），None 表示一直等待
+        :type timeout: Optional[float]
+        :return: 记录列表，超时返回空列表
+        :rtype: list
+        """
+        return [pickle.loads(data) for data in self.drain_batch_bytes(max_items, timeout)]
+
+    def get_many(self, block: bool = True, timeout: Optional[float] = None,
+                 max_messages_to_get: int = 256) -> list:
+        """批量取出记录，接口与 ``faster_fifo.Queue.get_many`` 一致.
+
+        :param block: 是否等待
+        :type block: bool
+        :param timeout: 等待超时时间（秒）
+        :type timeout: Optional[float]
+        :param max_messages_to_get: 最多取出的记录数
+        :type max_messages_to_get: int
+        :return: 记录列表
+        :rtype: list
+        :raises queue.Empty: 无记录可取
+        """
+        items = self.drain_batch(max_messages_to_get, timeout if block else 0)
+        if not items:
+            raise queue.Empty
+        return items
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        """取出单条记录，兼容 ``multiprocessing.Queue.get``.
+
+        :param block: 是否等待
+        :type block: bool
+        :param timeout: 等待超时时间（秒）
+        :type timeout: Optional[float]
+        :return: 队列中的对象
+        :raises queue.Empty: 无记录可取
+        """
+        if not self._pending:
+            self._pending = self.get_many(block, timeout)
+            self._pending.reverse()
+        return self._pending.pop()
+
+    def get_nowait(self):
+        """非阻塞取出单条记录."""
+        return self.get(block=False)
+
+
+class SharedRingQueue(LogQueueBase):
+    """基于共享内存环形缓冲区的多生产者单消费者队列.
+
+    工作进程将序列化后的日志记录以 ``[4字节长度][数据]`` 的帧格式写入共享内存，
+    监听进程每次唤醒后通过 :meth:`drain_batch` 一次取出一批记录。
+    头尾指针为单调递增的 64 位计数器，保存在共享内存头部。
+
+    .. note:: Python 没有跨进程的原子操作，生产者之间仍通过一把锁串行化写入，
+              但不再经过 ``multiprocessing.Queue`` 的 feeder 线程和管道，
+              且只有在已用字节数越过低水位线时才释放一次信号量唤醒监听进程。
+    """
+
+    _HEADER = struct.Struct("<QQ")  # head, tail
+    _FRAME = struct.Struct("<I")    # 单条记录长度
+
+    def __init__(self, capacity: int = 4 * 1024 * 1024, low_watermark: int = 1):
+        """初始化共享内存环形队列.
+
+        共享内存在第一次使用（或传递给子进程）时才真正创建，
+        避免 spawn 方式下子进程重新导入模块时泄漏共享内存段。
+
+        :param capacity: 环形缓冲区数据区大小（字节）
+        :type capacity: int
+        :param low_watermark: 唤醒监听进程的低水位线（字节），1 表示由空变为非空时唤醒
+        :type low_watermark: int
+        """
+        super().__init__()
+        self._capacity = capacity
+        self._low_watermark = max(1, low_watermark)
+        self._lock = multiprocessing.Lock()
+        self._not_empty = multiprocessing.Semaphore(0)
+        self._shm = None
+        self._shm_name = None
+        self._owner = False
+
+    def open(self) -> "SharedRingQueue":
+        """创建或挂载共享内存.
+
+        fork 方式创建的子进程直接继承对象而不经过序列化，
+        因此必须在启动任何子进程之前调用一次。
+
+        :return: 队列自身
+        :rtype: SharedRingQueue
+        """
+        self._buffer()
+        return self
+
+    def __getstate__(self):
+        """序列化时只传递共享内存名称和同步原语."""
+        self._buffer()
+        return {
+            **self._base_state(),
+            "capacity": self._capacity,
+            "low_watermark": self._low_watermark,
+            "lock": self._lock,
+            "not_empty": self._not_empty,
+            "shm_name": self._shm_name,
+        }
+
+    def __setstate__(self, state):
+        """反序列化时按名称重新挂载共享内存."""
+        self._restore_base_state(state)
+        self._capacity = state["capacity"]
+        self._low_watermark = state["low_watermark"]
+        self._lock = state["lock"]
+        self._not_empty = state["not_empty"]
+        self._shm = None
+        self._shm_name = state["shm_name"]
+        self._owner = False
+
+    def _buffer(self) -> memoryview:
+        """获取共享内存缓冲区，首次调用时创建或挂载.
+
+        :return: 共享内存缓冲区
+        :rtype: memoryview
+        """
+        if self._shm is None:
+            if self._shm_name is None:
+                self._shm = shared_memory.SharedMemory(
+                    create=True, size=self._HEADER.size + self._capacity
+                )
+                self._shm_name = self._shm.name
+                self._owner = True
+                self._HEADER.pack_into(self._shm.buf, 0, 0, 0)
+            else:
+                self._shm = shared_memory.SharedMemory(name=self._shm_name)
+        return self._shm.buf
+
+    def _write(self, buf: memoryview, pos: int, data) -> None:
+        """将数据写入环形区，必要时回绕."""
+        offset = self._HEADER.size
+        start = pos % self._capacity
+        first = min(len(data), self._capacity - start)
+        buf[offset + start:offset + start + first] = data[:first]
+        if first < len(data):
+            buf[offset:offset + len(data) - first] = data[first:]
+
+    def _read(self, buf: memoryview, pos: int, size: int) -> bytes:
+        """从环形区读取数据，必要时回绕."""
+        offset = self._HEADER.size
+        start = pos % self._capacity
+        first = min(size, self._capacity - start)
+        data = bytes(buf[offset + start:offset + start + first])
+        if first < size:
+            data += bytes(buf[offset:offset + size - first])
+        return data
+
+    def put_bytes(self, data: bytes, block: bool = True, timeout: Optional[float] = None) -> None:
+        """写入一条已序列化的记录.
+
+        :param data: 序列化后的记录
+        :type data: bytes
+        :param block: 缓冲区已满时是否等待
+        :type block: bool
+        :param timeout: 等待超时时间（秒），None 表示一直等待
+        :type timeout: Optional[float]
+        :raises ValueError: 单条记录超过缓冲区容量
+        :raises queue.Full: 缓冲区已满且不等待或等待超时
+        """
+        frame = memoryview(self._FRAME.pack(len(data)) + data)
+        size = len(frame)
+        if size > self._capacity:
+            raise ValueError(f"日志记录过大: {size} > {self._capacity}")
+
+        buf = self._buffer()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                head, tail = self._HEADER.unpack_from(buf, 0)
+                used = tail - head
+                if self._capacity - used >= size:
+                    self._write(buf, tail, frame)
+                    self._HEADER.pack_into(buf, 0, head, tail + size)
+                    break
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise queue.Full
+            time.sleep(0.001)
+
+        # 只有越过低水位线时才唤醒监听进程
+        if used < self._low_watermark <= used + size:
+            self._not_empty.release()
+
+    def offer_many_bytes(self, items: List[bytes]) -> int:
+        """不等待地写入多条已序列化的记录，只加一次锁.
+
+        :param items: 序列化后的记录列表
+        :type items: List[bytes]
+        :return: 写入成功的记录数
+        :rtype: int
+        """
+        buf = self._buffer()
+        count = 0
+        with self._lock:
+            head, tail = self._HEADER.unpack_from(buf, 0)
+            used = start_used = tail - head
+            for data in items:
+                size = self._FRAME.size + len(data)
+                if self._capacity - used < size:
+                    break
+                self._write(buf, tail, self._FRAME.pack(len(data)))
+                self._write(buf, tail + self._FRAME.size, data)
+                tail += size
+                used += size
+                count += 1
+            self._HEADER.pack_into(buf, 0, head, tail)
+
+        if count < len(items):
+            self._count_dropped(len(items) - count)
+        if start_used < self._low_watermark <= used:
+            self._not_empty.release()
+        return count
+
+    def drain_batch_bytes(self, max_items: int = 256, timeout: Optional[float] = None) -> List[bytes]:
+        """取出一批原始记录.
+
+        缓冲区为空时等待唤醒信号。
+
+        :param max_items: 单批最多取出的记录数
+        :type max_items: int
+        :param timeout: 等待超时时间（秒），None 表示一直等待
+        :type timeout: Optional[float]
+        :return: 原始记录列表，超时返回空列表
+        :rtype: List[bytes]
+        """
+        buf = self._buffer()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                head, tail = self._HEADER.unpack_from(buf, 0)
+                if tail != head:
+                    items = []
+                    while head != tail and len(items) < max_items:
+                        (length,) = self._FRAME.unpack(self._read(buf, head, self._FRAME.size))
+                        items.append(self._read(buf, head + self._FRAME.size, length))
+                        head += self._FRAME.size + length
+                    self._HEADER.pack_into(buf, 0, head, tail)
+                    return items
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return []
+            if not self._not_empty.acquire(timeout=remaining):
+                return []
+
+    def qsize(self) -> int:
+        """返回缓冲区中已使用的字节数（近似值）."""
+        head, tail = self._HEADER.unpack_from(self._buffer(), 0)
+        return tail - head
+
+    def empty(self) -> bool:
+        """判断缓冲区是否为空."""
+        return self.qsize() == 0
+
+    def close(self) -> None:
+        """关闭共享内存，创建者同时删除共享内存段."""
+        if self._shm is None:
+            return
+        shm, self._shm = self._shm, None
+        shm.close()
+        if self._owner:
+            shm.unlink()
+
+
+if faster_fifo is not None:
+    class FasterFifoQueue(LogQueueBase):
+        """基于 faster_fifo 的日志传输队列.
+
+        faster_fifo 在共享内存循环缓冲区上实现多进程队列，``get_many`` 一次唤醒取出整批记录。
+        记录在放入前已序列化，因此 dumps/loads 只做字节拷贝。
+        """
+
+        def __init__(self, capacity: int = 16 * 1024 * 1024):
+            """初始化 faster_fifo 队列.
+
+            :param capacity: 循环缓冲区大小（字节）
+            :type capacity: int
+            """
+            super().__init__()
+            self._queue = faster_fifo.Queue(max_size_bytes=capacity, dumps=bytes, loads=bytes)
+
+        def __getstate__(self):
+            """序列化时传递内部队列和共享状态."""
+            return {**self._base_state(), "queue": self._queue}
+
+        def __setstate__(self, state):
+            """反序列化时恢复内部队列和共享状态."""
+            self._restore_base_state(state)
+            self._queue = state["queue"]
+
+        def put_bytes(self, data: bytes, block: bool = True, timeout: Optional[float] = None) -> None:
+            """写入一条已序列化的记录.
+
+            :param data: 序列化后的记录
+            :type data: bytes
+            :param block: 队列已满时是否等待
+            :type block: bool
+            :param timeout: 等待超时时间（秒），None 表示一直等待
+            :type timeout: Optional[float]
+            :raises queue.Full: 队列已满且不等待或等待超时
+            """
+            self._queue.put(data, block, 1e9 if timeout is None else timeout)
+
+        def offer_many_bytes(self, items: List[bytes]) -> int:
+            """不等待地写入多条已序列化的记录，放不下时逐条写入.
+
+            :param items: 序列化后的记录列表
+            :type items: List[bytes]
+            :return: 写入成功的记录数
+            :rtype: int
+            """
+            try:
+                self._queue.put_many_nowait(items)
+                return len(items)
+            except queue.Full:
+                return super().offer_many_bytes(items)
+
+        def drain_batch_bytes(self, max_items: int = 256, timeout: Optional[float] = None) -> List[bytes]:
+            """取出一批原始记录，队列为空时等待.
+
+            :param max_items: 单批最多取出的记录数
+            :type max_items: int
+            :param timeout: 等待超时时间（秒），None 表示一直等待
+            :type timeout: Optional[float]
+            :return: 原始记录列表，超时返回空列表
+            :rtype: List[bytes]
+            """
+            try:
+                return self._queue.get_many(
+                    block=True,
+                    timeout=1e9 if timeout is None else timeout,
+                    max_messages_to_get=max_items
+                )
+            except queue.Empty:
+                return []
+
+        def qsize(self) -> int:
+            """返回队列中的记录数（近似值）."""
+            return self._queue.qsize()
+
+        def empty(self) -> bool:
+            """判断队列是否为空."""
+            return self._queue.empty()
+
+        def close(self) -> None:
+            """关闭队列."""
+            self._queue.close()
+
+
+def create_log_queue() -> LogQueueBase:
+    """创建日志传输队列.
+
+    安装了 faster_fifo 时使用 :class:`FasterFifoQueue`，否则使用 :class:`SharedRingQueue`。
+
+    :return: 日志传输队列
+    :rtype: LogQueueBase
+    """
+    if faster_fifo is not None:
+        return FasterFifoQueue()
+    return SharedRingQueue()
+
+
+# 大小单位（与 loguru 的 rotation 写法一致）
+_SIZE_UNITS = {
+    "b": 1, "kb": 1000, "mb": 1000 ** 2, "gb": 1000 ** 3,
+    "kib": 1024, "mib": 1024 ** 2, "gib": 1024 ** 3,
+}
+# 时间单位（秒）
+_DURATION_UNITS = {
+    "second": 1, "minute": 60, "hour": 3600, "day": 86400, "week": 7 * 86400, "month": 30 * 86400,
+}
+# 支持的压缩格式
+_COMPRESSIONS = ("zip", "gz", "bz2", "xz", "tar", "tar.gz", "tar.bz2", "tar.xz")
+# 单次 writev 最多提交的缓冲区个数
+_IOV_MAX = 1024
+
+
+def _parse_size(rotation: Optional[str]) -> Optional[int]:
+    """解析按大小轮转的规则，如 ``"10 MB"``.
+
+    :param rotation: 轮转规则
+    :type rotation: Optional[str]
+    :return: 字节数，未配置时返回 None
+    :rtype: Optional[int]
+    :raises ValueError: 不是按大小轮转的规则
+    """
+    if not rotation:
+        return None
+    match = re.fullmatch(r"\s*([\d.]+)\s*([kmg]?i?b)\s*", rotation, re.IGNORECASE)
+    if match is None:
+        raise ValueError(f"不支持的轮转规则: {rotation}")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).lower()])
+
+
+def _parse_retention(retention: Optional[str]):
+    """解析保留规则，如 ``"7 days"`` 或 ``"20"``.
+
+    :param retention: 保留规则
+    :type retention: Optional[str]
+    :return: (保留文件个数, 保留秒数)，未配置的一项为 None
+    :rtype: tuple
+    :raises ValueError: 无法解析的保留规则
+    """
+    if not retention:
+        return None, None
+    retention = str(retention).strip()
+    if retention.isdigit():
+        return int(retention), None
+    match = re.fullmatch(r"([\d.]+)\s*(second|minute|hour|day|week|month)s?", retention, re.IGNORECASE)
+    if match is None:
+        raise ValueError(f"不支持的保留规则: {retention}")
+    return None, float(match.group(1)) * _DURATION_UNITS[match.group(2).lower()]
+
+
+class _BatchFileWriter:
+    """带缓冲的日志文件写入器.
+
+    格式化后的日志编码为字节后追加到内存列表，累计达到 ``flush_bytes``
+    或距第一条未写入日志超过 ``flush_interval`` 秒时，才通过一次 ``os.writev``
+    （Windows 下为 ``os.write``）批量写入文件，减少系统调用次数。
+    超时写出由每个写入器常驻的一个后台线程负责，不再为每个缓冲窗口创建定时器线程。
+    支持按大小轮转、按个数或时间保留以及压缩旧日志。
+
+    既可以由监听进程直接调用 :meth:`write`，也可以作为 loguru 的流式 sink 使用。
+
+    .. note:: 故意不提供 ``flush`` 方法，否则 loguru 会在每条日志后调用它。
+    """
+
+    def __init__(self, file_path: str, flush_bytes: int = 64 * 1024, flush_interval: float = 0.05,
+                 encoding: str = "utf-8", rotation: Optional[str] = None,
+                 retention: Optional[str] = None, compression: Optional[str] = None):
+        """初始化缓冲写入器.
+
+        :param file_path: 日志文件路径
+        :type file_path: str
+        :param flush_bytes: 触发写入的缓冲字节数
+        :type flush_bytes: int
+        :param flush_interval: 缓冲日志的最长停留时间（秒）
+        :type flush_interval: float
+        :param encoding: 文件编码
+        :type encoding: str
+        :param rotation: 按大小轮转的规则，如 "10 MB"
+        :type rotation: Optional[str]
+        :param retention: 保留规则，如 "7 days", "20"
+        :type retention: Optional[str]
+        :param compression: 压缩格式，如 "zip", "gz"
+        :type compression: Optional[str]
+        :raises ValueError: 不支持的轮转、保留或压缩规则
+        """
+        if compression and compression not in _COMPRESSIONS:
+            raise ValueError(f"不支持的压缩格式: {compression}")
+
+        self.file_path = file_path
+        self._flush_bytes = flush_bytes
+        self._flush_interval = flush_interval
+        self._encoding = encoding
+        self._rotation_size = _parse_size(rotation)
+        self._retention_count, self._retention_seconds = _parse_retention(retention)
+        self._compression = compression
+        self._fd = None
+        self._file_size = 0
+        self._chunks = []
+        self._size = 0
+        self._lock = threading.Lock()
+        # 缓冲区中有等待超时写出的日志
+        self._pending = threading.Event()
+        self._stopped = threading.Event()
+        # 所属的 io_uring 写入器组，达到写入阈值时整组一起提交
+        self._group = None
+        self._open()
+        self._flusher = threading.Thread(target=self._flush_loop, name="hans_loguru_flusher", daemon=True)
+        self._flusher.start()
+
+    def _open(self) -> None:
+        """以追加方式打开日志文件."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+        self._fd = os.open(self.file_path, flags, 0o644)
+        self._file_size = os.fstat(self._fd).st_size
+
+    def write(self, message: str) -> None:
+        """追加一条格式化后的日志.
+
+        :param message: 格式化后的日志文本
+        :type message: str
+        """
+        self.write_bytes(message.encode(self._encoding))
+
+    def write_bytes(self, data: bytes) -> None:
+        """追加一条已编码的日志.
+
+        :param data: 已编码的日志
+        :type data: bytes
+        """
+        flush_group = False
+        with self._lock:
+            self._chunks.append(data)
+            self._size += len(data)
+            if self._size >= self._flush_bytes:
+                if self._group is None:
+                    self._write_out()
+                else:
+                    flush_group = True
+            elif not self._pending.is_set():
+                self._pending.set()
+        if flush_group:
+            self._group.flush()
+
+    def _flush_loop(self) -> None:
+        """后台刷新线程：缓冲区有日志后等待 ``flush_interval`` 秒再写出，直到写入器停止."""
+        while True:
+            self._pending.wait()
+            if self._stopped.wait(self._flush_interval):
+                return
+            with self._lock:
+                self._pending.clear()
+                self._write_out()
+
+    def _write_out(self) -> None:
+        """将缓冲区一次性写入文件（调用方需持有锁）."""
+        if not self._chunks or self._fd is None:
+            return
+        chunks, size = self._chunks, self._size
+        self._chunks = []
+        self._size = 0
+
+        if self._rotation_size is None:
+            self._write_chunks(chunks, size)
+            return
+
+        # 按轮转大小切分本批日志，保证每个文件不超过轮转大小
+        start = 0
+        while start < len(chunks):
+            end, batch_size = start, 0
+            while end < len(chunks) and self._file_size + batch_size + len(chunks[end]) <= self._rotation_size:
+                batch_size += len(chunks[end])
+                end += 1
+            if end == start:
+                if self._file_size:
+                    self._rotate()
+                    continue
+                # 单条日志超过轮转大小时单独写入一个文件
+                batch_size = len(chunks[end])
+                end += 1
+            self._write_chunks(chunks[start:end], batch_size)
+            start = end
+
+    def _write_chunks(self, chunks: List[bytes], size: int) -> None:
+        """通过 writev 将多段数据写入文件.
+
+        :param chunks: 已编码的日志片段
+        :type chunks: List[bytes]
+        :param size: 片段总字节数
+        :type size: int
+        """
+        if hasattr(os, "writev"):
+            for start in range(0, len(chunks), _IOV_MAX):
+                batch = chunks[start:start + _IOV_MAX]
+                self._write_remaining(batch, os.writev(self._fd, batch))
+        else:
+            self._write_all(memoryview(b"".join(chunks)))
+        self._file_size += size
+
+    def _write_remaining(self, chunks: List[bytes], written: int) -> None:
+        """部分写入时逐块补齐剩余内容.
+
+        :param chunks: 已提交写入的日志片段
+        :type chunks: List[bytes]
+        :param written: 已写入的字节数
+        :type written: int
+        """
+        for chunk in chunks:
+            if written >= len(chunk):
+                written -= len(chunk)
+                continue
+            self._write_all(memoryview(chunk)[written:])
+            written = 0
+
+    def _take_batch(self) -> Optional[tuple]:
+        """取出可以交给写入器组整批提交的缓冲数据（调用方需持有锁）.
+
+        需要轮转或片段数超过 ``IOV_MAX`` 时由本写入器直接写出，返回 None。
+
+        :return: (日志片段列表, 总字节数)，没有可提交的数据时为 None
+        :rtype: Optional[tuple]
+        """
+        if not self._chunks or self._fd is None:
+            return None
+        if len(self._chunks) > _IOV_MAX or (
+                self._rotation_size is not None and self._file_size + self._size > self._rotation_size):
+            self._write_out()
+            return None
+        chunks, size = self._chunks, self._size
+        self._chunks = []
+        self._size = 0
+        return chunks, size
+
+    def _finish_batch(self, chunks: List[bytes], size: int, written: int) -> None:
+        """处理写入器组提交的结果（调用方需持有锁）.
+
+        :param chunks: 已提交的日志片段
+        :type chunks: List[bytes]
+        :param size: 片段总字节数
+        :type size: int
+        :param written: 实际写入的字节数，负数表示提交失败
+        :type written: int
+        """
+        if written < 0:
+            # 提交失败时改用 writev 重写，真正的写入错误由 writev 抛出
+            self._write_chunks(chunks, size)
+            return
+        self._write_remaining(chunks, written)
+        self._file_size += size
+
+    def _write_all(self, view: memoryview) -> None:
+        """循环写入直到数据全部写完."""
+        while view:
+            view = view[os.write(self._fd, view):]
+
+    def _rotate(self) -> None:
+        """轮转日志文件：重命名当前文件，按需压缩并清理过期文件."""
+        os.close(self._fd)
+        self._fd = None
+        root, ext = os.path.splitext(self.file_path)
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        rotated_path = f"{root}.{timestamp}{ext}"
+        os.replace(self.file_path, rotated_path)
+        self._open()
+
+        if self._compression:
+            self._compress(rotated_path)
+        if self._retention_count is not None or self._retention_seconds is not None:
+            self._apply_retention(root, ext)
+
+    def _compress(self, path: str) -> None:
+        """压缩已轮转的日志文件并删除原文件.
+
+        :param path: 已轮转的日志文件路径
+        :type path: str
+        """
+        target = f"{path}.{self._compression}"
+        if self._compression == "zip":
+            import zipfile
+            with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.write(path, arcname=os.path.basename(path))
+        elif self._compression.startswith("tar"):
+            import tarfile
+            mode = "w" if self._compression == "tar" else "w:" + self._compression.split(".")[1]
+            with tarfile.open(target, mode) as archive:
+                archive.add(path, arcname=os.path.basename(path))
+        else:
+            import shutil
+            import gzip
+            import bz2
+            import lzma
+            opener = {"gz": gzip.open, "bz2": bz2.open, "xz": lzma.open}[self._compression]
+            with open(path, "rb") as source, opener(target, "wb") as dest:
+                shutil.copyfileobj(source, dest)
+        os.remove(path)
+
+    def _apply_retention(self, root: str, ext: str) -> None:
+        """按保留规则删除旧的轮转文件.
+
+        :param root: 日志文件路径（不含扩展名）
+        :type root: str
+        :param ext: 日志文件扩展名
+        :type ext: str
+        """
+        import glob
+        pattern = f"{glob.escape(root)}.*{glob.escape(ext)}*"
+        files = sorted(
+            (path for path in glob.glob(pattern) if path != self.file_path),
+            key=os.path.getmtime,
+            reverse=True
+        )
+        expired = []
+        if self._retention_count is not None:
+            expired = files[self._retention_count:]
+        if self._retention_seconds is not None:
+            deadline = time.time() - self._retention_seconds
+            expired += [path for path in files if os.path.getmtime(path) < deadline and path not in expired]
+        for path in expired:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stop(self) -> None:
+        """写出剩余日志并关闭文件，由 loguru 在移除 sink 时调用."""
+        self._stopped.set()
+        self._pending.set()
+        with self._lock:
+            self._write_out()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+class _WriterGroup:
+    """通过 io_uring 一次提交多个日志文件写入的写入器组.
+
+    组内任一写入器的缓冲达到写入阈值时，所有写入器的缓冲数据作为一批
+    ``writev`` 请求一起提交，代替逐个文件写入；定时写出仍由各写入器自行完成。
+    """
+
+    def __init__(self, writers: List[_BatchFileWriter], submitter):
+        """初始化写入器组.
+
+        :param writers: 组内的写入器
+        :type writers: List[_BatchFileWriter]
+        :param submitter: io_uring 提交器
+        :type submitter: IoUringSubmitter
+        """
+        self._writers = writers
+        self._submitter = submitter
+        for writer in writers:
+            writer._group = self
+
+    def flush(self) -> None:
+        """一次提交组内所有写入器的缓冲数据."""
+        with contextlib.ExitStack() as stack:
+            for writer in self._writers:
+                stack.enter_context(writer._lock)
+            batches = []
+            for writer in self._writers:
+                batch = writer._take_batch()
+                if batch is not None:
+                    batches.append((writer, *batch))
+            if not batches:
+                return
+            results = self._submitter.writev_many([(writer._fd, chunks) for writer, chunks, _ in batches])
+            for (writer, chunks, size), written in zip(batches, results):
+                writer._finish_batch(chunks, size, written)
+
+    def close(self) -> None:
+        """解散写入器组并释放 io_uring 资源."""
+        for writer in self._writers:
+            writer._group = None
+        self._submitter.close()
+
+
+class _QueueForwardHandler(logging.Handler):
+    """add_fast 使用的转发处理器.
+
+    在 ``QueueListener`` 线程中把进程内排队的 loguru 记录（或标准库 LogRecord）
+    转换为 :class:`LogRecord` 并发送到跨进程队列。
+    编码后的记录先暂存，进程内队列已取空或暂存达到 ``batch_size`` 条时一次发送，
+    连续产生的日志只需加一次跨进程队列的锁。
+    """
+
+    # 单次发送的最大记录数
+    batch_size = 64
+
+    def __init__(self, build_record, processing_queue: LogQueueBase, on_record=None):
+        """初始化转发处理器.
+
+        :param build_record: 由 loguru 记录构建 LogRecord 的函数
+        :param processing_queue: 传送消息的队列
+        :type processing_queue: LogQueueBase
+        :param on_record: 每条记录构建完成后的回调（如写入UI缓冲区），
+                          提供时低于监听进程最低级别的记录也会构建，只是不再发送
+        """
+        super().__init__()
+        self._build_record = build_record
+        self._queue = processing_queue
+        self._on_record = on_record
+        # 进程内队列，为空时立即发送暂存的记录
+        self.source = None
+        self._pending = []
+
+    def handle(self, record) -> bool:
+        """转发一条记录，跳过标准库 Handler 的过滤和加锁流程.
+
+        :param record: loguru 记录字典或标准库 LogRecord
+        :return: 是否已处理
+        :rtype: bool
+        """
+        level_no = record["level"].no if isinstance(record, dict) else record.levelno
+        forward = level_no >= self._queue.min_level_no
+        if not forward and self._on_record is None:
+            return True
+
+        if isinstance(record, dict):
+            log_record = self._build_record(record, record["thread"].id)
+        else:
+            # QueueHandler 已将异常堆栈合并进 record.msg
+            log_record = LogRecord(
+                record.getMessage(),
+                record.levelname,
+                _pid,
+                record.thread,
+                round(record.created * 1e6) * 1000,
+                record.filename,
+                record.lineno,
+                record.funcName,
+                record.name,
+                None,
+            )
+        if forward:
+            self._pending.append(encode_record(log_record))
+        if self._on_record is not None:
+            self._on_record(log_record)
+        if len(self._pending) >= self.batch_size or self.source is None or self.source.empty():
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        """发送暂存的记录."""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._queue.offer_many_bytes(pending)
+
+    def reset(self, source) -> None:
+        """fork 后在子进程中切换进程内队列，丢弃从父进程继承的暂存记录.
+
+        :param source: 新的进程内队列
+        """
+        self.source = source
+        self._pending = []
+
+    def emit(self, record) -> None:
+        """转发一条记录."""
+        self.handle(record)
+
+
 class HansLoguru():
     """多进程日志记录核心类.
 
@@ -107,7 +1312,42 @@ class HansLoguru():
     """
 
     # 定义一个队列,用于存储日志信息
-    hans_loguru_queue = multiprocessing.Queue()
+    hans_loguru_queue = create_log_queue()
+    # 监听进程单次最多处理的日志条数
+    BATCH_SIZE = 256
+    # 子进程终端输出格式（进程/线程ID由 loguru 按记录取值，fork 继承后依然正确）
+    SUBPROCESS_FORMAT = (
+        "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+        "<level>{level: <8}</level> | "
+        "<cyan>P{process}</cyan>/<magenta>T{thread}</magenta> | "
+        "<cyan>{file.name}</cyan> | "
+        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+        "<level>{message}</level>"
+    )
+    # 是否将监听进程绑定到独立的 CPU 核心（仅支持 sched_setaffinity 的平台）
+    PIN_LISTENER_CPU = True
+    # 安装 sink 时是否让调用进程避开监听进程的 CPU 核心，会修改调用进程的 CPU 亲和性，
+    # 默认关闭，建议只在专用的工作进程中开启
+    AVOID_LISTENER_CPU = False
+    # 当前进程已安装的队列 sink 及其配置，fork 出的子进程会继承该状态
+    _installed_sink = None
+    # 当前进程所有 sink 中的最低级别编号，低于该级别的 dbg 调用直接返回
+    _enabled_level_no = 0
+    # add_fast 使用的进程内队列、转发线程和标准库日志处理器
+    _fast_queue = None
+    _fast_listener = None
+    _fast_stdlib_handler = None
+    # add_async 添加的 [(loguru handler id, 异步写入器)]
+    _async_sinks = []
+    # 监听进程中直接格式化写入的文件输出，相同格式的文件共用一个格式化函数
+    # [(格式化函数, [(最低级别编号, 写入器), ...] 按级别升序)]
+    _direct_sinks = []
+    # 多个直接写入的文件共用的 io_uring 写入器组，不可用时为 None
+    _writer_group = None
+    # 监听进程中直接格式化输出的终端 (最低级别编号, 格式化函数, 输出流)，未启用时为 None
+    _console_sink = None
+    # 监听进程中是否还有需要经过 loguru 的工作进程日志输出
+    _uses_loguru_sinks = False
     # 定义一个监听器,用于监听日志信息
     listener = None
 
@@ -130,14 +1370,49 @@ class HansLoguru():
         pass
     
     @classmethod
-    def add(cls, processing_queue: multiprocessing.Queue, level="TRACE",
+    def _build_record(cls, record: dict, thread_id: Optional[int] = None) -> LogRecord:
+        """由 loguru 的 record 构建跨进程传递的日志记录.
+
+        :param record: loguru 日志记录
+        :type record: dict
+        :param thread_id: 产生日志的线程ID，None 表示当前线程
+        :type thread_id: Optional[int]
+        :return: 日志记录
+        :rtype: LogRecord
+        """
+        # 处理异常信息
+        exception_str = None
+        if record["exception"] is not None:
+            exc_type, exc_value, exc_tb = record["exception"]
+            if exc_type is not None:
+                exception_str = _format_exception(
+                    exc_type, exc_value, exc_tb, full=record["level"].no >= _WARNING_NO
+                )
+
+        return LogRecord(
+            record["message"],
+            record["level"].name,
+            _pid,
+            threading.get_ident() if thread_id is None else thread_id,
+            round(record["time"].timestamp() * 1e6) * 1000,
+            record["file"].name,
+            record["line"],
+            record["function"],
+            record["name"],
+            exception_str,
+        )
+
+    @classmethod
+    def add(cls, processing_queue: LogQueueBase, level="TRACE",
             console_output: bool = False, console_level: str = "TRACE"):
         """子进程初始化logger方法.
 
-        每个子进程创建时，需使用此方法初始化logger。
+        以 spawn 方式创建的子进程需使用此方法初始化logger。
+        以 fork 方式创建的子进程会直接继承父进程的 sink（进程ID在 fork 后自动刷新），
+        以相同参数再次调用时不会重建 sink。
 
         :param processing_queue: 传送消息的队列
-        :type processing_queue: multiprocessing.Queue
+        :type processing_queue: LogQueueBase
         :param level: 日志消息传送到队列的最低级别
         :type level: str
         :param console_output: 是否在子进程中也输出到终端
@@ -145,54 +1420,203 @@ class HansLoguru():
         :param console_level: 子进程终端输出的日志级别
         :type console_level: str
         """
+        if cls._sink_installed(processing_queue, level, console_output, console_level):
+            return
         logger.remove()
 
         # 添加队列处理器 - 传递完整的记录信息
+        # 队列已满时丢弃日志而不阻塞业务代码，丢弃数量由监听进程汇总输出
         def queue_sink(msg):
-            # 处理异常信息
-            exception_str = None
-            if msg.record["exception"] is not None:
-                exc_type, exc_value, exc_tb = msg.record["exception"]
-                if exc_type is not None:
-                    import traceback
-                    exception_str = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
-
-            log_data = {
-                "type": "worker",
-                "message": msg.record["message"],
-                "level": msg.record["level"].name,
-                "process": os.getpid(),
-                "thread": threading.current_thread().ident,
-                "time": msg.record["time"].isoformat(),
-                "file": msg.record["file"].name,
-                "line": msg.record["line"],
-                "function": msg.record["function"],
-                "name": msg.record["name"],
-                "exception": exception_str
-            }
-            processing_queue.put(log_data)
-
-        logger.add(queue_sink, level=level)
+            processing_queue.offer_bytes(encode_record(cls._build_record(msg.record)))
+
+        cls._avoid_listener_cpu(processing_queue)
+
+        # 低于监听进程最低输出级别的日志不会被写出，交给 loguru 在构建记录前直接过滤
+        level_no = level if isinstance(level, int) else logger.level(level.upper()).no
+        sink_level_no = max(level_no, processing_queue.min_level_no)
+        logger.add(queue_sink, level=sink_level_no)
+        HansLoguru._enabled_level_no = sink_level_no
 
         # 如果启用了子进程终端输出
         if console_output and sys.stderr is not None:
-            # 定义子进程终端输出格式
-            process_id = os.getpid()
-            thread_id = threading.current_thread().ident
-            subprocess_fmt = (
-                "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-                "<level>{level: <8}</level> | "
-                f"<cyan>P{process_id}</cyan>/<magenta>T{thread_id}</magenta> | "
-                "<cyan>{file.name}</cyan> | "
-                "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-                "<level>{message}</level>"
-            )
+            HansLoguru._enabled_level_no = min(sink_level_no, logger.level(console_level.upper()).no)
             logger.add(
                 sys.stderr,
-                format=subprocess_fmt,
+                format=cls.SUBPROCESS_FORMAT,
                 level=console_level.upper()
             )
 
+    @classmethod
+    def add_fast(cls, processing_queue: LogQueueBase, level="TRACE", capture_stdlib: bool = False):
+        """快速模式的子进程初始化logger方法.
+
+        loguru 的 sink 只把原始记录放入进程内的 ``queue.SimpleQueue``（C 实现），
+        由标准库 ``QueueListener`` 后台线程负责构建、编码日志记录并发送到跨进程队列，
+        调用日志的线程不再承担序列化开销。
+
+        :param processing_queue: 传送消息的队列
+        :type processing_queue: LogQueueBase
+        :param level: 日志消息传送到队列的最低级别
+        :type level: str
+        :param capture_stdlib: 是否同时收集标准库 logging 的日志
+        :type capture_stdlib: bool
+        """
+        if cls._sink_installed(processing_queue, "fast", level, capture_stdlib):
+            return
+        level_no = level if isinstance(level, int) else logger.level(level.upper()).no
+        cls._install_fast(
+            processing_queue,
+            max(level_no, processing_queue.min_level_no),
+            _QueueForwardHandler(cls._build_record, processing_queue),
+            capture_stdlib
+        )
+
+    @classmethod
+    def _install_fast(cls, processing_queue: LogQueueBase, level_no: int,
+                      handler: logging.Handler, capture_stdlib: bool):
+        """安装快速模式的 sink 和转发线程.
+
+        :param processing_queue: 传送消息的队列
+        :type processing_queue: LogQueueBase
+        :param level_no: sink 的最低级别编号
+        :type level_no: int
+        :param handler: 转发线程中处理记录的处理器
+        :type handler: logging.Handler
+        :param capture_stdlib: 是否同时收集标准库 logging 的日志
+        :type capture_stdlib: bool
+        """
+        logger.remove()
+        cls._stop_fast_listener()
+        cls._avoid_listener_cpu(processing_queue)
+
+        def queue_sink(msg):
+            HansLoguru._fast_queue.put(msg.record)
+
+        HansLoguru._enabled_level_no = level_no
+        logger.add(queue_sink, level=level_no)
+
+        HansLoguru._fast_queue = queue.SimpleQueue()
+        if capture_stdlib:
+            HansLoguru._fast_stdlib_handler = logging.handlers.QueueHandler(HansLoguru._fast_queue)
+            logging.getLogger().addHandler(HansLoguru._fast_stdlib_handler)
+        handler.reset(HansLoguru._fast_queue)
+        HansLoguru._fast_listener = logging.handlers.QueueListener(HansLoguru._fast_queue, handler)
+        HansLoguru._fast_listener.start()
+        cls._register_fast_finalizer()
+
+    @staticmethod
+    def dbg(fmt: str, *args, **kwargs) -> None:
+        """惰性格式化的 DEBUG 日志.
+
+        代替 ``logger.debug(f"...")``：参数只在日志确实会被输出时才格式化，
+        DEBUG 低于当前进程 sink 的最低级别时直接返回。
+        参数本身计算代价较大时可使用 ``logger.opt(lazy=True).debug("{}", lambda: expensive())``。
+
+        :param fmt: ``str.format`` 风格的日志消息
+        :type fmt: str
+        :param args: 格式化参数
+        :param kwargs: 格式化参数
+        """
+        if _DEBUG_NO < HansLoguru._enabled_level_no:
+            return
+        logger.opt(depth=1).debug(fmt, *args, **kwargs)
+
+    @staticmethod
+    def _stop_fast_listener():
+        """停止 add_fast 的转发线程，转发完剩余日志."""
+        if HansLoguru._fast_stdlib_handler is not None:
+            logging.getLogger().removeHandler(HansLoguru._fast_stdlib_handler)
+            HansLoguru._fast_stdlib_handler = None
+        if HansLoguru._fast_listener is not None:
+            HansLoguru._fast_listener.stop()
+            for handler in HansLoguru._fast_listener.handlers:
+                handler.flush()
+            HansLoguru._fast_listener = None
+
+    @staticmethod
+    def _restart_fast_listener():
+        """fork 后在子进程中重建 add_fast 的进程内队列和转发线程.
+
+        线程不会被 fork 继承，父进程队列中尚未转发的日志也不应在子进程中重复发送。
+        """
+        old_listener = HansLoguru._fast_listener
+        if old_listener is None:
+            return
+        HansLoguru._fast_queue = queue.SimpleQueue()
+        if HansLoguru._fast_stdlib_handler is not None:
+            HansLoguru._fast_stdlib_handler.queue = HansLoguru._fast_queue
+        for handler in old_listener.handlers:
+            handler.reset(HansLoguru._fast_queue)
+        HansLoguru._fast_listener = logging.handlers.QueueListener(HansLoguru._fast_queue, *old_listener.handlers)
+        HansLoguru._fast_listener.start()
+
+    @staticmethod
+    def _register_fast_finalizer(_=None):
+        """注册退出回调：进程退出时（包括 multiprocessing 子进程）先把进程内队列中的日志转发完."""
+        if HansLoguru._fast_listener is not None:
+            multiprocessing.util.Finalize(None, HansLoguru._stop_fast_listener, exitpriority=10)
+
+    @classmethod
+    def add_async(cls, file_path: str, level="TRACE", format: Optional[str] = None,
+                  fsync_interval: Optional[float] = 1.0) -> AsyncFileSink:
+        """单进程 asyncio 程序的日志文件输出.
+
+        不启动监听进程，日志由当前事件循环中的后台任务批量写入文件，
+        省去跨进程传输的开销。必须在事件循环内调用，退出前需 ``await HansLoguru.stop_async()``。
+
+        :param file_path: 日志文件路径
+        :type file_path: str
+        :param level: 写入文件的最低日志级别
+        :type level: str
+        :param format: 日志格式，None 时使用默认格式
+        :type format: Optional[str]
+        :param fsync_interval: 两次 fsync 之间的最短间隔（秒），None 表示不主动 fsync
+        :type fsync_interval: Optional[float]
+        :return: 异步写入器
+        :rtype: AsyncFileSink
+        """
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        sink = AsyncFileSink(file_path, batch_size=cls.BATCH_SIZE, fsync_interval=fsync_interval)
+        if format is None:
+            format = (
+                "{time:YYYY-MM-DD HH:mm:ss.SSS} | "
+                "{level: <8} | "
+                "P{process}/T{thread} | "
+                "{file.name} | "
+                "{name}:{function}:{line} - "
+                "{message}"
+            )
+        handler_id = logger.add(sink.write, level=level, format=format, colorize=False)
+        HansLoguru._async_sinks.append((handler_id, sink))
+        return sink
+
+    @classmethod
+    async def stop_async(cls) -> None:
+        """移除 add_async 添加的输出，写出剩余日志并关闭文件."""
+        sinks, HansLoguru._async_sinks = HansLoguru._async_sinks, []
+        for handler_id, sink in sinks:
+            logger.remove(handler_id)
+            await sink.stop()
+
+    @classmethod
+    def _sink_installed(cls, processing_queue: LogQueueBase, *options) -> bool:
+        """判断当前进程是否已安装（或经 fork 继承）了相同配置的队列 sink.
+
+        未安装时记录本次配置，返回 False。
+
+        :param processing_queue: 传送消息的队列
+        :type processing_queue: LogQueueBase
+        :param options: add 的其余参数
+        :return: 是否已安装
+        :rtype: bool
+        """
+        config = (cls, options)
+        installed = HansLoguru._installed_sink
+        if installed is not None and installed[0] is processing_queue and installed[1] == config:
+            return True
+        HansLoguru._installed_sink = (processing_queue, config)
+        return False
+
     @classmethod
     def add_init(cls, log_files: Optional[List[LogFileConfig]] = None,
                  console_config: Optional[ConsoleConfig] = None):
@@ -215,8 +1639,10 @@ class HansLoguru():
         console_format = console_config.format
 
         # 监听进程自身日志配置
-        listener_logger = logger.bind(is_listener=True)
-        listener_logger.remove()
+        # 复制出一个独立的 logger（handler 互不共享），工作进程日志不会经过监听进程自身的 sink，
+        # 各 sink 也不再需要逐条调用 filter 函数区分两类日志
+        logger.remove()
+        listener_logger = copy.deepcopy(logger)
         thread_id = threading.current_thread().ident
         process_id = os.getpid()
         listener_fmt = (
@@ -235,8 +1661,7 @@ class HansLoguru():
             listener_logger.add(
                 sys.stderr,
                 format=listener_fmt,
-                level=console_level.upper(),
-                filter=lambda record: "is_listener" in record["extra"]
+                level=console_level.upper()
             )
 
         # 注意：监听进程自身的日志不写入文件，避免与工作进程日志文件冲突
@@ -261,15 +1686,31 @@ class HansLoguru():
 
         # 工作进程日志处理器配置 - 终端输出
         # 修复: 检查 sys.stderr 是否可用
+        cls._direct_sinks = []
+        cls._uses_loguru_sinks = False
+        cls._console_sink = None
         if console_enabled and sys.stderr is not None:
-            logger.add(
-                sys.stderr,
-                format=worker_fmt,
-                level=console_level.upper(),
-                filter=lambda record: "is_listener" not in record["extra"]
-            )
+            # 优先使用预编译的格式化函数直接输出，Windows 控制台的颜色仍交给 loguru 适配
+            colorize = console_config.colorize and sys.stderr.isatty()
+            formatter = None
+            if not (colorize and os.name == "nt"):
+                try:
+                    formatter = compile_format(worker_fmt, _level_no, _level_ansi if colorize else None)
+                except ValueError as e:
+                    listener_logger.debug(f"终端日志格式无法预编译，回退到 loguru: {e}")
+            if formatter is not None:
+                cls._console_sink = (_level_no(console_level.upper()), formatter, sys.stderr)
+            else:
+                logger.add(
+                    sys.stderr,
+                    format=worker_fmt,
+                    level=console_level.upper()
+                )
+                cls._uses_loguru_sinks = True
 
         # 工作进程日志处理器配置 - 文件输出
+        # 格式字符串 -> (格式化函数, [(最低级别编号, 写入器), ...])
+        direct_groups = {}
         if log_files:
             for log_config in log_files:
                 # 确保日志目录存在
@@ -281,27 +1722,181 @@ class HansLoguru():
                 # 注意：配置中的格式需要使用 extra 字段来访问进程/线程信息
                 file_format = log_config.format if log_config.format else worker_fmt
 
+                # 优先使用预编译的格式化函数和缓冲写入器直接写入，绕过 loguru
+                try:
+                    if file_format not in direct_groups:
+                        direct_groups[file_format] = (compile_format(file_format, _level_no), [])
+                    writer = _BatchFileWriter(
+                        log_config.file_path,
+                        rotation=log_config.rotation,
+                        retention=log_config.retention,
+                        compression=log_config.compression
+                    )
+                except ValueError as e:
+                    listener_logger.debug(f"日志文件 {log_config.file_path} 无法直接写入，回退到 loguru: {e}")
+                else:
+                    direct_groups[file_format][1].append((_level_no(log_config.level), writer))
+                    continue
+
                 add_kwargs = {
-                    "sink": log_config.file_path,
                     "format": file_format,
-                    "level": log_config.level,
-                    "filter": lambda record: "is_listener" not in record["extra"]
+                    "level": log_config.level
                 }
 
-                # 添加可选参数
-                if log_config.rotation:
-                    add_kwargs["rotation"] = log_config.rotation
-                if log_config.retention:
-                    add_kwargs["retention"] = log_config.retention
-                if log_config.compression:
-                    add_kwargs["compression"] = log_config.compression
+                if log_config.rotation or log_config.retention or log_config.compression:
+                    # 按时间轮转等规则依赖 loguru 自身的文件管理，仍使用路径 sink
+                    add_kwargs["sink"] = log_config.file_path
+                    if log_config.rotation:
+                        add_kwargs["rotation"] = log_config.rotation
+                    if log_config.retention:
+                        add_kwargs["retention"] = log_config.retention
+                    if log_config.compression:
+                        add_kwargs["compression"] = log_config.compression
+                else:
+                    # 普通文件使用缓冲写入器，批量写入减少系统调用
+                    add_kwargs["sink"] = _BatchFileWriter(log_config.file_path)
+                    add_kwargs["colorize"] = False
 
                 logger.add(**add_kwargs)
+                cls._uses_loguru_sinks = True
+
+        for formatter, targets in direct_groups.values():
+            if targets:
+                targets.sort(key=lambda target: target[0])
+                cls._direct_sinks.append((formatter, targets))
+
+        # 多个文件时尝试通过 io_uring 一次提交所有文件的写入
+        cls._writer_group = None
+        writers = [writer for _, targets in cls._direct_sinks for _, writer in targets]
+        if len(writers) > 1:
+            submitter = create_submitter()
+            if submitter is not None:
+                cls._writer_group = _WriterGroup(writers, submitter)
 
         return listener_logger
 
     @classmethod
-    def listener_process(cls, processing_queue: multiprocessing.Queue,
+    def _dispatch(cls, message: LogRecord):
+        """将一条工作进程日志分发到各输出目标.
+
+        :param message: 日志记录
+        :type message: LogRecord
+        """
+        level_no = _level_no(message.level)
+        # 相同格式的文件只格式化、编码一次，再按级别分发到各文件
+        for formatter, targets in cls._direct_sinks:
+            data = None
+            for sink_level, writer in targets:
+                if level_no < sink_level:
+                    break
+                if data is None:
+                    data = formatter(message).encode("utf-8")
+                writer.write_bytes(data)
+
+        if cls._console_sink is not None:
+            console_level, formatter, stream = cls._console_sink
+            if level_no >= console_level:
+                stream.write(formatter(message))
+
+        if not cls._uses_loguru_sinks:
+            return
+
+        # 构建日志消息，如果有异常信息则附加
+        log_message = message.message
+        if message.exception:
+            log_message = f"{log_message}\n{message.exception}"
+
+        logger.bind(
+            process=message.process,
+            thread=message.thread,
+            file=message.file,
+            line=message.line,
+            function=message.function,
+            name=message.name,  # 绑定name字段
+            time=time_ns_to_iso(message.time)
+        ).log(message.level, log_message)
+
+    @staticmethod
+    def _dropped_record(count: int) -> LogRecord:
+        """构建报告日志丢弃数量的 CRITICAL 记录.
+
+        :param count: 丢弃的记录数
+        :type count: int
+        :return: 日志记录
+        :rtype: LogRecord
+        """
+        return LogRecord(
+            f"日志队列已满，丢弃了 {count} 条日志",
+            "CRITICAL",
+            os.getpid(),
+            threading.get_ident(),
+            time.time_ns(),
+            os.path.basename(__file__),
+            0,
+            "listener_process",
+            __name__,
+            None,
+        )
+
+    @classmethod
+    def _pin_listener_cpu(cls):
+        """将监听进程绑定到当前可用 CPU 中的最后一个核心.
+
+        可用核心不足 3 个时不绑定，避免挤占主进程和工作进程。
+        """
+        if not cls.PIN_LISTENER_CPU or not hasattr(os, "sched_setaffinity"):
+            return
+        cpus = sorted(os.sched_getaffinity(0))
+        if len(cpus) < 3:
+            return
+        try:
+            os.sched_setaffinity(cls.listener.pid, {cpus[-1]})
+        except OSError as e:
+            logger.debug(f"绑定监听进程 CPU 失败: {e}")
+            return
+        cls.hans_loguru_queue.listener_cpu = cpus[-1]
+
+    @classmethod
+    def _avoid_listener_cpu(cls, processing_queue: LogQueueBase):
+        """让当前进程避开监听进程绑定的 CPU 核心.
+
+        仅在 :attr:`AVOID_LISTENER_CPU` 开启时生效。
+
+        :param processing_queue: 传送消息的队列
+        :type processing_queue: LogQueueBase
+        """
+        listener_cpu = processing_queue.listener_cpu
+        if not cls.AVOID_LISTENER_CPU or listener_cpu < 0 or not hasattr(os, "sched_setaffinity"):
+            return
+        cpus = os.sched_getaffinity(0) - {listener_cpu}
+        if cpus:
+            try:
+                os.sched_setaffinity(0, cpus)
+            except OSError:
+                pass
+
+    @classmethod
+    def _min_level_no(cls, log_files: Optional[List[LogFileConfig]] = None,
+                      console_config: Optional[ConsoleConfig] = None) -> int:
+        """计算监听进程所有输出目标中的最低日志级别编号.
+
+        :param log_files: 日志文件配置列表
+        :type log_files: Optional[List[LogFileConfig]]
+        :param console_config: 控制台日志配置对象
+        :type console_config: Optional[ConsoleConfig]
+        :return: 最低日志级别编号，没有任何输出目标时返回 0
+        :rtype: int
+        """
+        if console_config is None:
+            console_config = ConsoleConfig()
+
+        levels = [log_config.level for log_config in log_files or []]
+        if console_config.enabled and sys.stderr is not None:
+            levels.append(console_config.level)
+        return min((logger.level(level).no for level in levels), default=0)
+
+    @classmethod
+    def listener_process(cls, processing_queue: LogQueueBase,
                         log_files: Optional[List[LogFileConfig]] = None,
                         console_config: Optional[ConsoleConfig] = None):
         """日志监听进程函数.
@@ -309,7 +1904,7 @@ class HansLoguru():
         用于接受所有进程的日志信息，并进行汇总处理。
 
         :param processing_queue: 接收日志信息的队列
-        :type processing_queue: multiprocessing.Queue
+        :type processing_queue: LogQueueBase
         :param log_files: 日志文件配置列表
         :type log_files: Optional[List[LogFileConfig]]
         :param console_config: 控制台日志配置对象
@@ -317,35 +1912,43 @@ class HansLoguru():
         """
         # 自定义格式,显示原始进程和线程信息
         cls.listener_logger = cls.add_init(log_files, console_config)
-        
-        while True:
-            try:
-                message = processing_queue.get()
-                if message is None:
-                    cls.listener_logger.info("收到终止信号,监听进程即将退出")
-                    break
-                    
-                if message["type"] == "worker":
-                    # 构建日志消息，如果有异常信息则附加
-                    log_message = message["message"]
-                    if message.get("exception"):
-                        log_message = f"{log_message}\n{message['exception']}"
-
-                    logger.bind(
-                        process=message["process"],
-                        thread=message["thread"],
-                        file=message["file"],
-                        line=message["line"],
-                        function=message["function"],
-                        name=message["name"],  # 绑定name字段
-                        time=message["time"]
-                    ).log(message["level"], log_message)
-            except Exception as e:
-                cls.listener_logger.error(f"处理日志时出错: {e}")
+
+        running = True
+        while running:
+            batch = processing_queue.drain_batch_bytes(cls.BATCH_SIZE)
+            for data in batch:
+                try:
+                    message = decode_record(data)
+                    if message is None:
+                        cls.listener_logger.info("收到终止信号,监听进程即将退出")
+                        running = False
+                        break
+
+                    cls._dispatch(message)
+                except Exception as e:
+                    cls.listener_logger.error(f"处理日志时出错: {e}")
+
+            # 终端输出每批只刷新一次
+            if cls._console_sink is not None:
+                cls._console_sink[2].flush()
+
+            # 积压处理完（不足一批）后再汇总报告丢弃的日志
+            if len(batch) < cls.BATCH_SIZE or not running:
+                dropped = processing_queue.take_dropped()
+                if dropped:
+                    cls._dispatch(cls._dropped_record(dropped))
+
+        # 移除所有 sink，确保缓冲区中的日志全部写入文件
+        logger.remove()
+        for _, targets in cls._direct_sinks:
+            for _, writer in targets:
+                writer.stop()
+        if cls._writer_group is not None:
+            cls._writer_group.close()
 
     @classmethod
     def listener_process_start(cls, log_files: Optional[List[LogFileConfig]] = None,
-                               console_config: Optional[ConsoleConfig] = None) -> multiprocessing.Queue:
+                               console_config: Optional[ConsoleConfig] = None) -> LogQueueBase:
         """开启监听进程.
 
         用于汇总所有监听信息进行处理。
@@ -355,13 +1958,16 @@ class HansLoguru():
         :param console_config: 控制台日志配置对象
         :type console_config: Optional[ConsoleConfig]
         :return: 用于接受日志信息的队列
-        :rtype: multiprocessing.Queue
+        :rtype: LogQueueBase
         """
+        cls.hans_loguru_queue.open()
+        cls.hans_loguru_queue.min_level_no = cls._min_level_no(log_files, console_config)
         cls.listener = multiprocessing.Process(
             target=HansLoguru.listener_process,
             args=(cls.hans_loguru_queue, log_files, console_config)
         )
         cls.listener.start()
+        cls._pin_listener_cpu()
         return cls.hans_loguru_queue
 
     @classmethod
@@ -370,8 +1976,16 @@ class HansLoguru():
 
         发送终止信号并等待进程结束。
         """
-        cls.hans_loguru_queue.put(None)
-        cls.listener.join() 
+        cls._stop_fast_listener()
+        cls.hans_loguru_queue.put_bytes(encode_record(None))
+        cls.listener.join()
+        cls.hans_loguru_queue.close()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=HansLoguru._restart_fast_listener)
+# multiprocessing 子进程启动时会清空继承的退出回调，需要重新注册
+multiprocessing.util.register_after_fork(HansLoguru, HansLoguru._register_fast_finalizer)
+
 
 class MyClass():
     """测试用例类.
@@ -394,13 +2008,13 @@ class MyClass():
         logger.info("子线程结束")
         time.sleep(1)
 
-    def worker_process(self, processing_queue: multiprocessing.Queue):
+    def worker_process(self, processing_queue: LogQueueBase):
         """工作进程函数.
 
         演示子进程中的日志记录配置和使用。
 
         :param processing_queue: 日志消息队列
-        :type processing_queue: multiprocessing.Queue
+        :type processing_queue: LogQueueBase
         """
         # HANS: B 每个子进程必须重新配置 logger
         HansLoguru.add(processing_queue)
@@ -50,12 +50,83 @@
 """
 
 from loguru import logger
-import multiprocessing
-import threading
-import os
+import itertools
 from typing import Optional, List
-from collections import deque
-from .hans_loguru import HansLoguru, LogFileConfig, ConsoleConfig
+from .hans_loguru import (
+    HansLoguru, LogFileConfig, ConsoleConfig, LogQueueBase, LogRecord, encode_record, _QueueForwardHandler
+)
+
+
+class LogRingBuffer:
+    """无锁的固定容量日志环形缓冲区.
+
+    写入方通过 ``itertools.count`` 领取槽位序号（``next()`` 在 C 层完成，GIL 下是原子的），
+    直接写入预分配列表的对应槽位，新日志覆盖最旧的日志；读取方复制整个列表后按序号重排。
+    并发写入时快照中最新的几条可能尚未写入或顺序略有交错，以换取写入不必加锁。
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """初始化环形缓冲区.
+
+        容量为 0 时缓冲区不保存任何日志。
+
+        :param capacity: 最大日志条数
+        :type capacity: int
+        :raises ValueError: 容量为负数
+        """
+        if capacity < 0:
+            raise ValueError("缓冲区容量不能为负数")
+        self._reset(capacity)
+
+    def _reset(self, capacity: int) -> None:
+        """以新的容量替换全部状态（单次赋值，读写双方看到的总是完整的一组状态）.
+
+        状态为 (槽位列表, 序号计数器, [已写入条数])。
+        """
+        self._state = ([None] * capacity, itertools.count(), [0])
+
+    @property
+    def maxlen(self) -> int:
+        """最大日志条数.
+
+        :return: 最大日志条数
+        :rtype: int
+        """
+        return len(self._state[0])
+
+    def append(self, item) -> None:
+        """写入一条日志.
+
+        :param item: 日志记录
+        """
+        slots, counter, written = self._state
+        if not slots:
+            return
+        index = next(counter)
+        slots[index % len(slots)] = item
+        if index >= written[0]:
+            written[0] = index + 1
+
+    def snapshot(self) -> list:
+        """按写入顺序返回缓冲区中日志的副本.
+
+        :return: 日志记录列表
+        :rtype: list
+        """
+        slots, _, written = self._state
+        items = list(slots)
+        if written[0] > len(items):
+            start = written[0] % len(items)
+            items = items[start:] + items[:start]
+        return [item for item in items if item is not None]
+
+    def clear(self) -> None:
+        """清空缓冲区."""
+        self._reset(self.maxlen)
+
+    def __len__(self) -> int:
+        slots, _, written = self._state
+        return min(written[0], len(slots))
 
 
 class HansLoguruUI(HansLoguru):
@@ -65,14 +136,12 @@ class HansLoguruUI(HansLoguru):
 
     主要特性：
         - 提供可配置大小的日志缓冲区
-        - 线程安全的缓冲区操作
-        - 自动收集所有日志到缓冲区
+        - 无锁的缓冲区写入和读取
+        - 自动收集当前进程的日志到缓冲区
     """
 
     # 日志缓冲区，用于存储历史日志（供UI组件使用）
-    log_buffer = deque(maxlen=1000)  # 默认保存1000条日志
-    # 日志缓冲区锁
-    log_buffer_lock = threading.Lock()
+    log_buffer = LogRingBuffer(1000)  # 默认保存1000条日志
 
     @classmethod
     def get_log_buffer(cls):
@@ -83,38 +152,38 @@ class HansLoguruUI(HansLoguru):
         :return: 日志记录列表
         :rtype: list
         """
-        with cls.log_buffer_lock:
-            return list(cls.log_buffer)
+        return cls.log_buffer.snapshot()
 
     @classmethod
     def clear_log_buffer(cls):
         """清空日志缓冲区."""
-        with cls.log_buffer_lock:
-            cls.log_buffer.clear()
+        cls.log_buffer.clear()
 
     @classmethod
     def set_buffer_size(cls, maxlen: int):
         """设置日志缓冲区大小.
 
-        :param maxlen: 最大日志条数
+        :param maxlen: 最大日志条数，为 0 时不保存日志
         :type maxlen: int
+        :raises ValueError: 条数为负数
         """
-        with cls.log_buffer_lock:
-            # 保存现有日志
-            existing_logs = list(cls.log_buffer)
-            # 创建新的缓冲区
-            cls.log_buffer = deque(existing_logs, maxlen=maxlen)
+        # 保留现有日志中最新的部分，填充好新缓冲区后再替换
+        buffer = LogRingBuffer(maxlen)
+        for log_record in cls.log_buffer.snapshot()[-maxlen:]:
+            buffer.append(log_record)
+        cls.log_buffer = buffer
 
     @classmethod
-    def add(cls, processing_queue: multiprocessing.Queue, level="TRACE",
+    def add(cls, processing_queue: LogQueueBase, level="TRACE",
             console_output: bool = False, console_level: str = "TRACE",
             enable_buffer: bool = True):
         """子进程初始化logger方法.
 
-        每个子进程创建时，需使用此方法初始化logger。重写父类方法，添加缓冲区支持。
+        以 spawn 方式创建的子进程需使用此方法初始化logger，fork 方式创建的子进程直接继承父进程的 sink。
+        重写父类方法，添加缓冲区支持。
 
         :param processing_queue: 传送消息的队列
-        :type processing_queue: multiprocessing.Queue
+        :type processing_queue: LogQueueBase
         :param level: 日志消息传送到队列的最低级别
         :type level: str
         :param console_output: 是否在子进程中也输出到终端
@@ -124,122 +193,88 @@ class HansLoguruUI(HansLoguru):
         :param enable_buffer: 是否启用日志缓冲（用于UI显示历史日志）
         :type enable_buffer: bool
         """
+        if cls._sink_installed(processing_queue, level, console_output, console_level, enable_buffer):
+            return
         logger.remove()
+        cls._avoid_listener_cpu(processing_queue)
 
         # 添加队列处理器 - 传递完整的记录信息
         def queue_sink(msg):
-            # 处理异常信息
-            exception_str = None
-            if msg.record["exception"] is not None:
-                exc_type, exc_value, exc_tb = msg.record["exception"]
-                if exc_type is not None:
-                    import traceback
-                    exception_str = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
-
-            log_data = {
-                "type": "worker",
-                "message": msg.record["message"],
-                "level": msg.record["level"].name,
-                "process": os.getpid(),
-                "thread": threading.current_thread().ident,
-                "time": msg.record["time"].isoformat(),
-                "file": msg.record["file"].name,
-                "line": msg.record["line"],
-                "function": msg.record["function"],
-                "name": msg.record["name"],
-                "exception": exception_str
-            }
-            processing_queue.put(log_data)
+            # 低于监听进程最低输出级别的日志只进入缓冲区，不再发送给监听进程
+            forward = msg.record["level"].no >= processing_queue.min_level_no
+            if not forward and not enable_buffer:
+                return
+
+            log_record = cls._build_record(msg.record)
+            if forward:
+                processing_queue.offer_bytes(encode_record(log_record))
 
             # 添加到缓冲区（用于UI显示）
             if enable_buffer:
-                with cls.log_buffer_lock:
-                    cls.log_buffer.append(log_data)
+                cls.log_buffer.append(log_record)
 
         logger.add(queue_sink, level=level)
+        HansLoguru._enabled_level_no = level if isinstance(level, int) else logger.level(level.upper()).no
 
         # 如果启用了子进程终端输出，调用父类的实现
         if console_output:
             import sys
             if sys.stderr is not None:
-                # 定义子进程终端输出格式
-                process_id = os.getpid()
-                thread_id = threading.current_thread().ident
-                subprocess_fmt = (
-                    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-                    "<level>{level: <8}</level> | "
-                    f"<cyan>P{process_id}</cyan>/<magenta>T{thread_id}</magenta> | "
-                    "<cyan>{file.name}</cyan> | "
-                    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-                    "<level>{message}</level>"
+                HansLoguru._enabled_level_no = min(
+                    HansLoguru._enabled_level_no, logger.level(console_level.upper()).no
                 )
                 logger.add(
                     sys.stderr,
-                    format=subprocess_fmt,
+                    format=cls.SUBPROCESS_FORMAT,
                     level=console_level.upper()
                 )
 
     @classmethod
-    def listener_process(cls, processing_queue: multiprocessing.Queue,
-                        log_files: Optional[List[LogFileConfig]] = None,
-                        console_config: Optional['ConsoleConfig'] = None,
-                        buffer_size: int = 1000):
-        """日志监听进程函数.
+    def add_fast(cls, processing_queue: LogQueueBase, level="TRACE", capture_stdlib: bool = False,
+                 enable_buffer: bool = True):
+        """快速模式的子进程初始化logger方法.
 
-        用于接受所有进程的日志信息，并进行汇总处理。重写父类方法，添加缓冲区支持。
+        调用日志的线程只把原始记录放入进程内队列，构建日志记录、发送到监听进程
+        以及写入缓冲区都在后台转发线程中完成。重写父类方法，添加缓冲区支持。
 
-        :param processing_queue: 接收日志信息的队列
-        :type processing_queue: multiprocessing.Queue
-        :param log_files: 日志文件配置列表
-        :type log_files: Optional[List[LogFileConfig]]
-        :param console_config: 控制台日志配置对象
-        :type console_config: Optional[ConsoleConfig]
-        :param buffer_size: 日志缓冲区大小
-        :type buffer_size: int
+        :param processing_queue: 传送消息的队列
+        :type processing_queue: LogQueueBase
+        :param level: 日志消息传送到队列的最低级别
+        :type level: str
+        :param capture_stdlib: 是否同时收集标准库 logging 的日志
+        :type capture_stdlib: bool
+        :param enable_buffer: 是否启用日志缓冲（用于UI显示历史日志）
+        :type enable_buffer: bool
         """
-        # 设置缓冲区大小
-        cls.set_buffer_size(buffer_size)
+        if cls._sink_installed(processing_queue, "fast", level, capture_stdlib, enable_buffer):
+            return
+        level_no = level if isinstance(level, int) else logger.level(level.upper()).no
+        if enable_buffer:
+            # 缓冲区保存所有级别的日志，低于监听进程最低级别的日志由转发线程跳过发送
+            handler = _QueueForwardHandler(cls._build_record, processing_queue, cls._buffer_append)
+        else:
+            level_no = max(level_no, processing_queue.min_level_no)
+            handler = _QueueForwardHandler(cls._build_record, processing_queue)
+        cls._install_fast(processing_queue, level_no, handler, capture_stdlib)
 
-        # 调用父类的 add_init
-        cls.listener_logger = cls.add_init(log_files, console_config)
-
-        while True:
-            try:
-                message = processing_queue.get()
-                if message is None:
-                    cls.listener_logger.info("收到终止信号，监听进程即将退出")
-                    break
-
-                if message["type"] == "worker":
-                    # 添加到缓冲区
-                    with cls.log_buffer_lock:
-                        cls.log_buffer.append(message)
-
-                    # 构建日志消息，如果有异常信息则附加
-                    log_message = message["message"]
-                    if message.get("exception"):
-                        log_message = f"{log_message}\n{message['exception']}"
-
-                    # 记录日志
-                    logger.bind(
-                        process=message["process"],
-                        thread=message["thread"],
-                        file=message["file"],
-                        line=message["line"],
-                        function=message["function"],
-                        name=message["name"],
-                        time=message["time"]
-                    ).log(message["level"], log_message)
-            except Exception as e:
-                cls.listener_logger.error(f"处理日志时出错: {e}")
+    @classmethod
+    def _buffer_append(cls, log_record: LogRecord):
+        """将一条日志记录写入缓冲区.
+
+        :param log_record: 日志记录
+        :type log_record: LogRecord
+        """
+        cls.log_buffer.append(log_record)
 
     @classmethod
     def listener_process_start(cls, log_files: Optional[List[LogFileConfig]] = None,
                                console_config: Optional['ConsoleConfig'] = None,
-                               buffer_size: int = 1000) -> multiprocessing.Queue:
+                               buffer_size: int = 1000) -> LogQueueBase:
         """开启监听进程.
 
         用于汇总所有监听信息进行处理。重写父类方法，添加缓冲区大小参数。
+        缓冲区属于调用进程（UI 所在进程），由该进程的 :meth:`add` / :meth:`add_fast` sink 写入，
+        监听进程不再保存一份无人读取的副本。
 
         :param log_files: 日志文件配置列表
         :type log_files: Optional[List[LogFileConfig]]
@@ -248,11 +283,7 @@ class HansLoguruUI(HansLoguru):
         :param buffer_size: 日志缓冲区大小
         :type buffer_size: int
         :return: 用于接受日志信息的队列
-        :rtype: multiprocessing.Queue
+        :rtype: LogQueueBase
         """
-        cls.listener = multiprocessing.Process(
-            target=cls.listener_process,
-            args=(cls.hans_loguru_queue, log_files, console_config, buffer_size)
-        )
-        cls.listener.start()
-        return cls.hans_loguru_queue
+        cls.set_buffer_size(buffer_size)
+        return super().listener_process_start(log_files, console_config)
@@ -8,14 +8,10 @@ import sys
 import os
 from multiprocessing import freeze_support
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
 from loguru import logger
 
 from lib.hans_loguru import HansLoguruUI
-from views import MainWindow
-from services.core import ConfigService
-from services import ServiceContainer
+
 
 def main():
     """应用主函数.
@@ -28,7 +24,12 @@ def main():
     - 全局日志级别控制
 
     使用HansLoguruUI支持UI历史日志显示。
+
+    Qt、视图和服务模块在函数内导入：spawn 方式启动的子进程（如日志监听进程）
+    会重新导入本模块，放在模块顶层会让子进程也加载 PySide6。
     """
+    from services.core import ConfigService
+    from services import ServiceContainer
 
     # 创建配置服务实例（自动加载配置文件，不存在则使用默认配置）
     config_service = ConfigService("./configs/config.json")
@@ -45,19 +46,24 @@ def main():
         console_config=console_config,
         buffer_size=2000  # 缓冲区大小可根据需要调整
     )
-    HansLoguruUI.add(HansLoguruUI.hans_loguru_queue)
+    # 快速模式：构建和发送日志记录都在后台转发线程中完成，不占用界面线程
+    HansLoguruUI.add_fast(HansLoguruUI.hans_loguru_queue)
     # HANS: E 主进程配置 logger
 
     # 创建服务容器（注入配置服务）
     container = ServiceContainer(config=config_service)
 
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QIcon
+    from views import MainWindow
+
     try:
         # 创建Qt应用
         app = QApplication(sys.argv)
         app.setStyle("Fusion")
 
-        # 设置应用图标
-        icon_path = None
+        # 设置应用图标（只解码一次，应用和主窗口共用同一个 QIcon）
+        app_icon = None
         try:
             if hasattr(sys, '_MEIPASS'):
                 icon_path = os.path.join(getattr(sys, '_MEIPASS'), 'resources', 'logo', 'window.ico')
@@ -65,8 +71,9 @@ def main():
                 icon_path = os.path.join(os.path.dirname(__file__), 'resources', 'logo', 'window.ico')
 
             if os.path.exists(icon_path):
-                logger.info(f"已加载应用图标: {icon_path}")
-                app.setWindowIcon(QIcon(icon_path))
+                app_icon = QIcon(icon_path)
+                app.setWindowIcon(app_icon)
+                logger.info("已加载应用图标: {}", icon_path)
         except Exception as e:
             logger.opt(exception=e).warning("未找到应用图标文件")
 
@@ -74,8 +81,8 @@ def main():
         window = MainWindow(container=container)
 
         # 为主窗口单独设置图标
-        if icon_path and os.path.exists(icon_path):
-            window.setWindowIcon(QIcon(icon_path))
+        if app_icon is not None:
+            window.setWindowIcon(app_icon)
 
         window.show()
 
@@ -5,9 +5,21 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
-from loguru import logger
+
+
+@lru_cache(maxsize=512)
+def _split_path(key_path: str) -> Tuple[str, ...]:
+    """拆分点号分隔的配置键路径（带缓存）.
+
+    :param key_path: 配置键路径，使用点号分隔
+    :type key_path: str
+    :return: 各级键名
+    :rtype: Tuple[str, ...]
+    """
+    return tuple(key_path.split('.'))
 
 
 @dataclass
@@ -22,6 +34,9 @@ class ConfigData:
         - is_modified: 配置是否已修改
         - is_valid: 配置是否有效
         - validation_errors: 验证错误列表
+
+    已查询过的键路径会记录在扁平索引中，再次查询时直接命中；
+    索引在 :meth:`set` 时清空，修改配置请通过 :meth:`set` 进行。
     """
 
     # 配置内容
@@ -33,12 +48,14 @@ class ConfigData:
     is_valid: bool = True
     validation_errors: list[str] = field(default_factory=list)
 
+    # 键路径到配置值的扁平索引
+    _index: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """后初始化处理.
 
         将字符串类型的file_path转换为Path对象。
         """
-        logger.trace(f"")
         if isinstance(self.file_path, str):
             self.file_path = Path(self.file_path)
 
@@ -54,16 +71,33 @@ class ConfigData:
         :return: 配置值或默认值
         :rtype: Any
         """
-        logger.trace(f"")
-        keys = key_path.split('.')
-        value = self.data
+        try:
+            return self._index[key_path]
+        except KeyError:
+            pass
 
+        value = self.data
         try:
-            for key in keys:
+            for key in _split_path(key_path):
                 value = value[key]
-            return value
         except (KeyError, TypeError, IndexError):
             return default
+        self._index[key_path] = value
+        return value
+
+    def node(self, key_path: str) -> Dict[str, Any]:
+        """获取配置子树.
+
+        同一前缀下需要读取多个配置项时，先取得子树再直接读取子键，
+        例如 ``node("logging").get("level")``。
+
+        :param key_path: 子树的配置键路径，使用点号分隔
+        :type key_path: str
+        :return: 子树字典，路径不存在或不是字典时返回空字典
+        :rtype: Dict[str, Any]
+        """
+        value = self.get(key_path)
+        return value if isinstance(value, dict) else {}
 
     def set(self, key_path: str, value: Any) -> None:
         """设置配置值.
@@ -75,18 +109,18 @@ class ConfigData:
         :param value: 要设置的值
         :type value: Any
         """
-        logger.trace(f"")
-        keys = key_path.split('.')
+        *parents, last = _split_path(key_path)
         data_ref = self.data
 
         # 导航到目标位置
-        for key in keys[:-1]:
+        for key in parents:
             if key not in data_ref:
                 data_ref[key] = {}
             data_ref = data_ref[key]
 
         # 设置值
-        data_ref[keys[-1]] = value
+        data_ref[last] = value
+        self._index.clear()
         self.is_modified = True
 
 
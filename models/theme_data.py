@@ -7,12 +7,13 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThemeData:
     """主题颜色令牌.
 
     所有颜色值均为 CSS 颜色字符串（如 "#ffffff"）。
-    frozen=True 保证主题实例不可变，切换时整体替换。
+    frozen=True 保证主题实例不可变，切换时整体替换；
+    slots=True 使实例不再携带 ``__dict__``，属性访问直接读取槽位。
     """
 
     name: str
@@ -2,5 +2,6 @@
 """图标资源模块."""
 
 from .antd_icons import ICONS
+from .svg_cache import clear_icon_cache, get_icon_pixmap
 
-__all__ = ["ICONS"]
+__all__ = ["ICONS", "clear_icon_cache", "get_icon_pixmap"]
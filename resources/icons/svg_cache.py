@@ -0,0 +1,73 @@
+# resources/icons/svg_cache.py
+"""SVG 图标位图缓存.
+
+图标 SVG 以字符串形式内置在 :data:`ICONS` 中。每个图标按尺寸只解析、渲染一次，
+得到白色的透明蒙版；需要某种颜色时用 ``CompositionMode_SourceIn`` 填充颜色即可，
+不再为每种颜色替换 SVG 字符串并重新解析。着色后的位图按 (图标名称, 颜色, 尺寸) 缓存，
+重绘时只需贴图。
+"""
+
+from functools import lru_cache
+
+from PySide6.QtCore import QByteArray, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+
+from .antd_icons import ICONS
+
+
+@lru_cache(maxsize=64)
+def _icon_mask(icon_name: str, pixel_size: int) -> QImage:
+    """将图标渲染为白色的透明蒙版.
+
+    :param icon_name: 图标名称，必须存在于 ICONS 中
+    :type icon_name: str
+    :param pixel_size: 蒙版边长（物理像素）
+    :type pixel_size: int
+    :return: 白色图标蒙版
+    :rtype: QImage
+    """
+    svg_str = ICONS[icon_name].replace('fill="currentColor"', 'fill="#ffffff"')
+    renderer = QSvgRenderer(QByteArray(svg_str.encode('utf-8')))
+
+    mask = QImage(pixel_size, pixel_size, QImage.Format.Format_ARGB32_Premultiplied)
+    mask.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(mask)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    renderer.render(painter, QRectF(0, 0, pixel_size, pixel_size))
+    painter.end()
+    return mask
+
+
+@lru_cache(maxsize=128)
+def get_icon_pixmap(icon_name: str, color: str, size: int, device_pixel_ratio: float) -> QPixmap:
+    """获取指定颜色和尺寸的图标位图.
+
+    :param icon_name: 图标名称，必须存在于 ICONS 中
+    :type icon_name: str
+    :param color: 图标颜色，如 ``"#888888"``
+    :type color: str
+    :param size: 图标边长（逻辑像素）
+    :type size: int
+    :param device_pixel_ratio: 设备像素比，高 DPI 屏幕按物理像素渲染
+    :type device_pixel_ratio: float
+    :return: 透明背景的图标位图
+    :rtype: QPixmap
+    """
+    image = _icon_mask(icon_name, round(size * device_pixel_ratio)).copy()
+
+    # 只保留蒙版不透明的部分，用目标颜色替换白色
+    painter = QPainter(image)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+    painter.fillRect(image.rect(), QColor(color))
+    painter.end()
+
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    return pixmap
+
+
+def clear_icon_cache() -> None:
+    """清空图标蒙版和着色位图缓存，在主窗口关闭时释放位图占用的内存."""
+    get_icon_pixmap.cache_clear()
+    _icon_mask.cache_clear()
@@ -7,9 +7,9 @@
     - 依赖注入
 """
 
-from typing import TYPE_CHECKING, Dict, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict
 
-from loguru import logger
 
 if TYPE_CHECKING:
     from services.core import ConfigService
@@ -34,14 +34,9 @@ class ServiceFactory:
         :param config: 配置服务实例
         :type config: ConfigService
         """
-        logger.trace("")
-
         # Core (构造时注入)
         self._config = config
 
-        # 懒加载单例缓存
-        self._theme_service: Optional["ThemeService"] = None
-
     # ==================== 属性 ====================
     @property
     def config(self) -> "ConfigService":
@@ -49,13 +44,14 @@ class ServiceFactory:
         return self._config
 
     # ==================== Theme 服务 ====================
-    @property
+    @cached_property
     def theme(self) -> "ThemeService":
-        """获取主题服务（懒加载）."""
-        if self._theme_service is None:
-            from services.core.theme import ThemeService
-            self._theme_service = ThemeService(config=self._config)
-        return self._theme_service
+        """获取主题服务（懒加载）.
+
+        首次访问时创建并写入实例 ``__dict__``，之后的访问直接读取实例属性。
+        """
+        from services.core.theme import ThemeService
+        return ThemeService(config=self._config)
 
     # ==================== Level 0: Network ====================
     
@@ -68,4 +64,4 @@ class ServiceFactory:
     # ==================== 清理 ====================
     def clear_all(self) -> None:
         """清理所有服务引用（不调用服务的清理方法）."""
-        self._theme_service = None
\ No newline at end of file
+        self.__dict__.pop("theme", None)
\ No newline at end of file
@@ -65,8 +65,6 @@ class ServiceContainer(QObject):
         :type parent: Optional[QObject]
         """
         super().__init__(parent)
-        logger.trace("")
-
         # Core (构造时注入)
         self._config = config
 
@@ -109,7 +107,3 @@ class ServiceContainer(QObject):
         self._factory.clear_all()
 
         logger.info("服务容器清理完成")
-
-    def __del__(self) -> None:
-        """析构函数."""
-        logger.trace("ServiceContainer 析构")
@@ -5,18 +5,38 @@
 采用依赖注入模式，通过构造函数接收配置文件路径。
 """
 
+import asyncio
 import json
+import mmap
 import os
-import datetime
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from copy import deepcopy
+from typing import Any, Dict, List, Optional, Set, Union
 from loguru import logger
 
+from lib.hans_loguru import ConsoleConfig, LogFileConfig
 from models.config_data import ConfigData
 from .defaults import DEFAULT_CONFIG
 from .validators import ConfigValidator, ValidationError
 
+# orjson 为可选依赖，未安装时使用标准库 json 解析
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 默认配置的 JSON 序列化结果：创建默认配置时反序列化得到独立副本，
+# 纯数据结构的反序列化比 deepcopy 的逐层递归复制快得多
+if orjson is not None:
+    _DEFAULT_CONFIG_JSON = orjson.dumps(DEFAULT_CONFIG)
+    _json_loads = orjson.loads
+else:
+    _DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG)
+    _json_loads = json.loads
+
+# 达到该大小的配置文件通过 mmap 直接交给 orjson 解析，省去一次整文件读入复制
+_MMAP_THRESHOLD = 1024 * 1024
+
 
 class ConfigService:
     """配置服务类.
@@ -59,8 +79,23 @@ class ConfigService:
 
         # 初始化输出路径
         self._output_paths: Dict[str, Path] = self._init_output_paths()
+        self._ensured_dirs: Set[str] = set()
         logger.info(f"ConfigService 已初始化，输出目录: {self._output_paths['root']}")
 
+    @classmethod
+    async def aload(cls, config_path: str) -> "ConfigService":
+        """异步创建配置服务实例.
+
+        在线程池中完成文件读取、解析和验证，不阻塞事件循环，
+        启动时可与其他异步初始化任务通过 ``asyncio.gather`` 并行执行。
+
+        :param config_path: 配置文件路径
+        :type config_path: str
+        :return: 配置服务实例
+        :rtype: ConfigService
+        """
+        return await asyncio.to_thread(cls, config_path)
+
     # ==================== 实例属性 ====================
     @property
     def config(self) -> ConfigData:
@@ -75,6 +110,8 @@ class ConfigService:
     def output_paths(self) -> Dict[str, Path]:
         """获取输出路径字典.
 
+        只计算路径，不保证目录已存在，写入前请通过 :meth:`ensure_dir` 获取目录。
+
         :return: 包含各个输出路径的字典 {"root", "logs"}
         :rtype: Dict[str, Path]
         """
@@ -107,41 +144,28 @@ class ConfigService:
         :return: LogFileConfig对象列表
         :rtype: list
         """
-        from lib.hans_loguru import LogFileConfig
-
         logger.trace("获取日志文件配置")
-        log_files = []
-
-        # 获取日志文件配置列表
-        files_config = self._config.get("logging.files", [])
 
-        for file_cfg in files_config:
-            # 检查是否启用
-            if not file_cfg.get("enabled", True):
-                logger.debug(f"日志文件 {file_cfg.get('name', 'unknown')} 已禁用，跳过")
-                continue
+        logging_node = self._config.node("logging")
 
-            # 构建日志文件路径
-            filename = file_cfg.get("filename", "app.log")
-            file_path = str(self._output_paths["logs"] / filename)
+        # 只处理已启用的日志文件，没有启用的日志文件时不创建日志目录
+        files_config = [cfg for cfg in logging_node.get("files", []) if cfg.get("enabled", True)]
+        logs_dir = str(self.ensure_dir("logs")) if files_config else None
 
-            # 获取日志级别（如果为null则使用全局级别）
-            level = file_cfg.get("level")
-            if level is None:
-                level = self._config.get("logging.level", "INFO")
+        # 文件未指定级别（null）时使用全局级别
+        global_level = logging_node.get("level", "INFO")
 
-            # 创建LogFileConfig对象
-            log_file = LogFileConfig(
-                file_path=file_path,
-                level=level,
+        log_files = [
+            LogFileConfig(
+                file_path=os.path.join(logs_dir, file_cfg.get("filename", "app.log")),
+                level=file_cfg.get("level") or global_level,
                 rotation=file_cfg.get("rotation"),
                 retention=file_cfg.get("retention"),
                 compression=file_cfg.get("compression"),
                 format=file_cfg.get("format")
             )
-
-            log_files.append(log_file)
-            logger.debug(f"已添加日志文件配置: {file_cfg.get('name', 'unknown')} -> {file_path} (级别: {level})")
+            for file_cfg in files_config
+        ]
 
         logger.info(f"已加载 {len(log_files)} 个日志文件配置")
         return log_files
@@ -154,19 +178,19 @@ class ConfigService:
         :return: ConsoleConfig对象
         :rtype: ConsoleConfig
         """
-        from lib.hans_loguru import ConsoleConfig
-
         logger.trace("获取控制台日志配置")
 
+        logging_node = self._config.node("logging")
+
         # 获取控制台配置字典
-        console_dict = self._config.get("logging.console", {})
+        console_dict = logging_node.get("console", {})
 
         # 获取各个配置项（如果没有配置则使用默认值）
         enabled = console_dict.get("enabled", True)
         level = console_dict.get("level")
         if level is None:
             # 如果控制台配置中没有level，使用全局level
-            level = self._config.get("logging.level", "INFO")
+            level = logging_node.get("level", "INFO")
         format_str = console_dict.get("format")
         colorize = console_dict.get("colorize", True)
 
@@ -178,14 +202,16 @@ class ConfigService:
             colorize=colorize
         )
 
-        logger.debug(f"已加载控制台配置 (启用: {enabled}, 级别: {level}, 颜色: {colorize})")
+        logger.debug("已加载控制台配置 (启用: {}, 级别: {}, 颜色: {})", enabled, level, colorize)
         return console_config
 
-    def save(self, file_path: Optional[Union[str, Path]] = None) -> None:
+    def save(self, file_path: Optional[Union[str, Path]] = None, *, validate: bool = True) -> None:
         """保存配置到文件.
 
         :param file_path: 保存路径，如果为None则使用config中的路径
         :type file_path: Optional[Union[str, Path]]
+        :param validate: 保存前是否验证配置；调用方已保证修改合法时可传 False 跳过
+        :type validate: bool
         :raises ValueError: 当未指定保存路径时
         """
         save_path = Path(file_path) if file_path else self._config.file_path
@@ -193,19 +219,27 @@ class ConfigService:
         if save_path is None:
             raise ValueError("未指定保存路径")
 
-        logger.trace(f"保存配置到文件: {save_path}")
+        logger.trace("保存配置到文件: {}", save_path)
+        tmp_path = save_path.with_name(save_path.name + ".tmp")
 
         try:
             # 验证配置
-            errors = ConfigValidator.validate_full_config(self._config.data)
-            if errors:
-                logger.warning(f"配置验证警告: {errors}")
+            if validate:
+                errors = ConfigValidator.validate_full_config(self._config.data)
+                if errors:
+                    logger.warning(f"配置验证警告: {errors}")
 
             # 确保目录存在
             save_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config.data, f, indent=4, ensure_ascii=False)
+            # 先整体序列化再一次写入临时文件，落盘后原子替换目标文件，
+            # 保存过程中崩溃也不会留下写了一半的配置文件
+            payload = json.dumps(self._config.data, indent=4, ensure_ascii=False).encode('utf-8')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, save_path)
 
             self._config.file_path = save_path
             self._config.is_modified = False
@@ -213,6 +247,8 @@ class ConfigService:
 
         except Exception as e:
             logger.opt(exception=e).error("保存配置文件失败")
+            # 写入或替换失败时清理临时文件，不在配置目录中遗留半成品
+            tmp_path.unlink(missing_ok=True)
             raise
 
     def validate(self) -> bool:
@@ -258,7 +294,7 @@ class ConfigService:
         # 根据模式确定根目录
         if auto_generate:
             # 自动生成模式：在根目录下创建时间戳子目录
-            time_str = datetime.datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+            time_str = time.strftime("%Y_%m_%d_%H_%M_%S")
             root_path = Path(root_dir) / time_str
             logger.info(f"使用自动生成模式，时间戳: {time_str}")
         else:
@@ -276,14 +312,25 @@ class ConfigService:
             "logs": root_path / logs_subdir,
         }
 
-        # 创建所有目录
-        for name, path in paths.items():
-            path.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"已创建目录: {name} -> {path}")
-
+        # 目录在首次使用时由 ensure_dir 创建，未写入输出的会话不会留下空目录
         logger.info(f"输出目录已初始化，根目录: {root_path}")
         return paths
 
+    def ensure_dir(self, name: str) -> Path:
+        """获取输出目录，首次获取时创建该目录.
+
+        :param name: 输出目录名称（"root"、"logs"）
+        :type name: str
+        :return: 输出目录路径
+        :rtype: Path
+        """
+        path = self._output_paths[name]
+        if name not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(name)
+            logger.debug("已创建目录: {} -> {}", name, path)
+        return path
+
     def _create_default(self) -> ConfigData:
         """创建默认配置数据.
 
@@ -292,7 +339,7 @@ class ConfigService:
         """
         logger.trace("创建默认配置")
         return ConfigData(
-            data=deepcopy(DEFAULT_CONFIG),
+            data=_json_loads(_DEFAULT_CONFIG_JSON),
             is_valid=True
         )
 
@@ -306,15 +353,23 @@ class ConfigService:
         :raises FileNotFoundError: 当配置文件不存在时
         :raises json.JSONDecodeError: 当JSON解析失败时
         """
-        logger.trace(f"从文件加载配置: {file_path}")
+        logger.trace("从文件加载配置: {}", file_path)
         file_path = Path(file_path)
 
         if not file_path.exists():
             raise FileNotFoundError(f"配置文件不存在: {file_path}")
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                loaded_data = json.load(f)
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                            loaded_data = orjson.loads(view)
+                    else:
+                        loaded_data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    loaded_data = json.load(f)
 
             # 验证配置
             errors = ConfigValidator.validate_full_config(loaded_data)
@@ -0,0 +1,72 @@
+# services/core/config/schema.py
+"""程序配置 JSON Schema 模块.
+
+本模块定义与 DEFAULT_CONFIG 结构对应的 JSON Schema，供 ConfigValidator 编译使用。
+未列出的键不做限制，便于配置向后兼容。
+"""
+
+#: 日志级别
+_LOG_LEVELS = ["TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"]
+
+#: 可为 null 的字符串
+_OPTIONAL_STRING = {"type": ["string", "null"]}
+
+#: 程序配置 JSON Schema
+CONFIG_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "appearance": {
+            "type": "object",
+            "properties": {
+                "theme": {"enum": ["dark", "light"]},
+            },
+        },
+        "output": {
+            "type": "object",
+            "properties": {
+                "auto_generate": {"type": "boolean"},
+                "root_dir": {"type": "string"},
+                "manual_dir": _OPTIONAL_STRING,
+                "subdirs": {
+                    "type": "object",
+                    "properties": {
+                        "logs": {"type": "string"},
+                    },
+                },
+            },
+        },
+        "logging": {
+            "type": "object",
+            "properties": {
+                "level": {"enum": _LOG_LEVELS},
+                "console": {
+                    "type": "object",
+                    "properties": {
+                        "enabled": {"type": "boolean"},
+                        "colorize": {"type": "boolean"},
+                        "format": {"type": "string"},
+                    },
+                },
+                "files": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "enabled": {"type": "boolean"},
+                            "filename": {"type": "string"},
+                            "level": {"enum": _LOG_LEVELS + [None]},
+                            "rotation": _OPTIONAL_STRING,
+                            "retention": _OPTIONAL_STRING,
+                            "compression": _OPTIONAL_STRING,
+                            "format": _OPTIONAL_STRING,
+                        },
+                    },
+                },
+                "backtrace": {"type": "boolean"},
+                "diagnose": {"type": "boolean"},
+            },
+        },
+    },
+}
@@ -1,12 +1,25 @@
 # services/config/validators.py
 """程序配置验证器模块.
 
-本模块提供配置验证功能的简化版实现。
+本模块提供配置验证功能。安装了 fastjsonschema 时，
+CONFIG_SCHEMA 在导入时编译为验证函数，每次验证只需调用一次编译结果；
+未安装时跳过结构验证。
 """
 
 from typing import Any, Dict, List
 from loguru import logger
 
+from .schema import CONFIG_SCHEMA
+
+# fastjsonschema 为可选依赖，未安装时不做结构验证
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+#: 编译后的配置验证函数，fastjsonschema 不可用时为 None
+_validate_schema = fastjsonschema.compile(CONFIG_SCHEMA) if fastjsonschema is not None else None
+
 
 class ValidationError(Exception):
     """配置验证错误异常类.
@@ -24,11 +37,20 @@ class ConfigValidator:
     def validate_full_config(cls, config: Dict[str, Any]) -> List[str]:
         """验证完整配置.
 
+        编译后的验证函数遇到第一个错误即停止，因此最多返回一条错误信息。
+
         :param config: 待验证的配置字典
         :type config: Dict[str, Any]
         :return: 验证错误信息列表，如果无错误则返回空列表
         :rtype: List[str]
         """
-        logger.trace(f"")
         all_errors = []
+        if _validate_schema is None:
+            return all_errors
+
+        try:
+            _validate_schema(config)
+        except fastjsonschema.JsonSchemaException as e:
+            logger.debug("配置验证失败: {}", e.message)
+            all_errors.append(e.message)
         return all_errors
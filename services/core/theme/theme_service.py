@@ -31,8 +31,9 @@ class ThemeService:
         :param config: 配置服务实例
         :type config: ConfigService
         """
-        logger.trace("")
         self._config = config
+        # 主题已切换但尚未写入配置文件
+        self._dirty = False
 
         # 从配置读取主题名称，默认 dark
         theme_name = self._config.config.get(self.CONFIG_KEY, "dark")
@@ -50,35 +51,50 @@ class ThemeService:
         """获取当前主题名称."""
         return self._current_theme.name
 
-    def set_theme(self, name: str) -> ThemeData:
+    def set_theme(self, name: str, persist: bool = True) -> ThemeData:
         """设置主题.
 
         :param name: 主题名称 ("light" / "dark")
         :type name: str
+        :param persist: 是否立即写入配置文件；为 False 时只修改内存中的配置，
+            由调用方稍后通过 :meth:`flush` 合并写入
+        :type persist: bool
         :return: 新的主题数据
         :rtype: ThemeData
         :raises ValueError: 未知的主题名称
         """
-        if name not in THEMES:
+        theme = THEMES.get(name)
+        if theme is None:
             raise ValueError(f"未知主题: {name}，可选: {list(THEMES.keys())}")
 
-        self._current_theme = THEMES[name]
+        self._current_theme = theme
 
         # 持久化
         self._config.config.set(self.CONFIG_KEY, name)
-        self._config.save()
+        self._dirty = True
+        if persist:
+            self.flush()
 
         logger.info(f"主题已切换为: {name}")
         return self._current_theme
 
-    def toggle_theme(self) -> ThemeData:
+    def flush(self) -> None:
+        """将尚未保存的主题选择写入配置文件."""
+        if self._dirty:
+            # 主题名称已在 set_theme 中校验，无需再验证整个配置
+            self._config.save(validate=False)
+            self._dirty = False
+
+    def toggle_theme(self, persist: bool = True) -> ThemeData:
         """在 light / dark 之间切换.
 
+        :param persist: 是否立即写入配置文件，参见 :meth:`set_theme`
+        :type persist: bool
         :return: 切换后的主题数据
         :rtype: ThemeData
         """
         new_name = "light" if self._current_theme.name == "dark" else "dark"
-        return self.set_theme(new_name)
+        return self.set_theme(new_name, persist)
 
     def get_available_themes(self) -> list[str]:
         """获取所有可用主题名称.
@@ -0,0 +1,52 @@
+# tests/test_formatter.py
+"""hans_loguru 预编译日志格式测试.
+
+运行: ``python -m unittest discover -s tests``
+"""
+
+import json
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.hans_loguru._formatter import compile_format  # noqa: E402
+from lib.hans_loguru.hans_loguru import LogRecord  # noqa: E402
+
+_LEVELS = {"TRACE": 5, "DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+_TRACEBACK = "Traceback (most recent call last):\nZeroDivisionError: division by zero\n"
+
+
+def _record(exception=None) -> LogRecord:
+    return LogRecord("出错了", "ERROR", 1, 2, 1_700_000_000_123_456_789, "main.py", 10, "run", "main", exception)
+
+
+def _file_format(filename: str) -> str:
+    with open(os.path.join(ROOT, "configs", "config.json"), encoding="utf-8") as f:
+        config = json.load(f)
+    for file_config in config["logging"]["files"]:
+        if file_config["filename"] == filename:
+            return file_config["format"]
+    raise KeyError(filename)
+
+
+class CompileFormatExceptionTest(unittest.TestCase):
+    """异常堆栈字段的处理."""
+
+    def test_shipped_error_log_format_writes_traceback_once(self):
+        formatter = compile_format(_file_format("error.log"), _LEVELS.get)
+        text = formatter(_record(_TRACEBACK))
+        self.assertEqual(text.count("ZeroDivisionError"), 1)
+        self.assertTrue(text.endswith("出错了\n" + _TRACEBACK))
+
+    def test_format_without_exception_appends_it(self):
+        formatter = compile_format("{level} - {message}", _LEVELS.get)
+        self.assertEqual(formatter(_record(_TRACEBACK)), "ERROR - 出错了\n" + _TRACEBACK)
+        self.assertEqual(formatter(_record()), "ERROR - 出错了\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
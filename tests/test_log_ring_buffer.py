@@ -0,0 +1,48 @@
+# tests/test_log_ring_buffer.py
+"""hans_loguru_ui 日志环形缓冲区测试.
+
+运行: ``python -m unittest discover -s tests``
+"""
+
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.hans_loguru.hans_loguru_ui import HansLoguruUI, LogRingBuffer  # noqa: E402
+
+
+class LogRingBufferTest(unittest.TestCase):
+
+    def test_keeps_newest_items(self):
+        buffer = LogRingBuffer(3)
+        for i in range(5):
+            buffer.append(i)
+        self.assertEqual(buffer.snapshot(), [2, 3, 4])
+        self.assertEqual(len(buffer), 3)
+
+    def test_zero_capacity_discards_items(self):
+        buffer = LogRingBuffer(0)
+        buffer.append("日志")
+        self.assertEqual(buffer.snapshot(), [])
+        self.assertEqual(len(buffer), 0)
+
+    def test_negative_capacity_rejected(self):
+        with self.assertRaises(ValueError):
+            LogRingBuffer(-1)
+
+    def test_set_buffer_size_zero(self):
+        original = HansLoguruUI.log_buffer
+        try:
+            HansLoguruUI.log_buffer.append("日志")
+            HansLoguruUI.set_buffer_size(0)
+            HansLoguruUI.log_buffer.append("日志")
+            self.assertEqual(HansLoguruUI.get_log_buffer(), [])
+        finally:
+            HansLoguruUI.log_buffer = original
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,9 +27,8 @@ class BaseViewModel(QObject):
         :param parent: 父对象
         :type parent: QObject, optional
         """
-        logger.trace(f"")
         super().__init__(parent)
-        logger.trace(f"初始化{self.__class__.__name__}")
+        logger.trace("初始化{}", self.__class__.__name__)
 
     def emit_error(self, error_message: str):
         """发射错误信号.
@@ -37,7 +36,6 @@ class BaseViewModel(QObject):
         :param error_message: 错误消息
         :type error_message: str
         """
-        logger.trace(f"")
         logger.error(f"{self.__class__.__name__}: {error_message}")
         self.error_occurred.emit(error_message)
 
@@ -46,11 +44,5 @@ class BaseViewModel(QObject):
 
         子类应该重写此方法以实现特定的清理逻辑。
         """
-        logger.trace(f"")
-        logger.debug(f"清理{self.__class__.__name__}资源")
+        logger.debug("清理{}资源", self.__class__.__name__)
         pass
-
-    def __del__(self):
-        """析构函数."""
-        logger.trace(f"")
-        logger.debug(f"{self.__class__.__name__} 析构")
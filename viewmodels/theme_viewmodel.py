@@ -8,7 +8,7 @@
 
 from typing import TYPE_CHECKING, Optional
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QTimer, Signal
 from loguru import logger
 
 from viewmodels.base_viewmodel import BaseViewModel
@@ -23,10 +23,16 @@ class ThemeViewModel(BaseViewModel):
 
     信号：
         theme_changed(ThemeData): 主题变更时发射，携带新的主题数据
+
+    主题切换立即生效，配置文件的写入延迟 ``SAVE_DELAY_MS`` 毫秒，
+    连续多次切换只写入一次。
     """
 
     theme_changed = Signal(object)  # ThemeData (用 object 避免 PySide6 注册问题)
 
+    # 切换主题后延迟保存配置的时间（毫秒）
+    SAVE_DELAY_MS = 500
+
     def __init__(self, theme_service: "ThemeService", parent=None):
         """初始化主题 ViewModel.
 
@@ -36,6 +42,13 @@ class ThemeViewModel(BaseViewModel):
         """
         super().__init__(parent)
         self._service = theme_service
+
+        # 合并连续切换的保存操作，每次切换都会重新计时
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._service.flush)
+
         logger.trace("ThemeViewModel 已初始化")
 
     @property
@@ -55,12 +68,21 @@ class ThemeViewModel(BaseViewModel):
         :type name: str
         """
         try:
-            theme = self._service.set_theme(name)
-            self.theme_changed.emit(theme)
+            theme = self._service.set_theme(name, persist=False)
         except ValueError as e:
             self.emit_error(str(e))
+            return
+        self._save_timer.start()
+        self.theme_changed.emit(theme)
 
     def toggle_theme(self) -> None:
         """切换主题并通知所有 View."""
-        theme = self._service.toggle_theme()
+        theme = self._service.toggle_theme(persist=False)
+        self._save_timer.start()
         self.theme_changed.emit(theme)
+
+    def cleanup(self):
+        """停止延迟保存，并立即写入尚未保存的主题选择."""
+        self._save_timer.stop()
+        self._service.flush()
+        super().cleanup()
@@ -5,32 +5,88 @@
 参照 electerm 的 UI 布局：左侧工具栏 + 右侧标签页内容区。
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget,
     QMenuBar, QMenu, QFileDialog, QMessageBox
 )
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, Slot
 from loguru import logger
 
 import ctypes
 import ctypes.wintypes
+import weakref
 
-from .tabs import LogTab
-from .tabs.placeholder_tab import PlaceholderTab
 from .sidebar import Sidebar
 from .sidebar.add_tab_menu import AddTabMenu
 from .styles.app_styles import AppStyles
 from .widgets.title_bar import TitleBar
 from viewmodels.theme_viewmodel import ThemeViewModel
 from models.theme_data import ThemeData
+from resources.icons import clear_icon_cache
 from version import APP_TITLE
 
 if TYPE_CHECKING:
     from services import ServiceContainer
 
 
+class _NCCALCSIZE_PARAMS(ctypes.Structure):
+    """WM_NCCALCSIZE 消息 lParam 指向的结构（只用到 rgrc）."""
+
+    _fields_ = [("rgrc", ctypes.wintypes.RECT * 3)]
+
+
+class _MONITORINFO(ctypes.Structure):
+    """GetMonitorInfoW 填充的显示器信息结构."""
+
+    _fields_ = [
+        ("cbSize", ctypes.wintypes.DWORD),
+        ("rcMonitor", ctypes.wintypes.RECT),
+        ("rcWork", ctypes.wintypes.RECT),
+        ("dwFlags", ctypes.wintypes.DWORD),
+    ]
+
+
+# user32 函数在导入时解析一次并声明参数类型；使用独立的 WinDLL 实例，
+# 避免修改 ctypes.windll.user32 上被其他模块共用的函数原型
+if hasattr(ctypes, "WinDLL"):
+    _user32 = ctypes.WinDLL("user32")
+    _MonitorFromWindow = _user32.MonitorFromWindow
+    _MonitorFromWindow.argtypes = [ctypes.wintypes.HWND, ctypes.wintypes.DWORD]
+    _MonitorFromWindow.restype = ctypes.wintypes.HMONITOR
+    _GetMonitorInfoW = _user32.GetMonitorInfoW
+    _GetMonitorInfoW.argtypes = [ctypes.wintypes.HMONITOR, ctypes.POINTER(_MONITORINFO)]
+    _GetMonitorInfoW.restype = ctypes.wintypes.BOOL
+else:
+    _user32 = None
+
+# MSG 结构中 message 字段的偏移，nativeEvent 先只读取消息编号
+_MSG_MESSAGE_OFFSET = ctypes.wintypes.MSG.message.offset
+
+# WM_NCHITTEST 返回值查找表，按边缘位掩码索引：左=1、右=2、上=4、下=8。
+# 同时命中多条边时（窗口过小）与角优先、再左右、再上下的判断顺序一致；
+# 非边缘区域一律返回 HTCLIENT，避免系统将其识别为标题栏触发 Aero Shake 等行为
+_HIT_TEST_LUT = (
+    1,   # 非边缘: HTCLIENT
+    10,  # 左: HTLEFT
+    11,  # 右: HTRIGHT
+    10,  # 左+右: HTLEFT
+    12,  # 上: HTTOP
+    13,  # 上+左: HTTOPLEFT
+    14,  # 上+右: HTTOPRIGHT
+    13,  # 上+左+右: HTTOPLEFT
+    15,  # 下: HTBOTTOM
+    16,  # 下+左: HTBOTTOMLEFT
+    17,  # 下+右: HTBOTTOMRIGHT
+    16,  # 下+左+右: HTBOTTOMLEFT
+    12,  # 上+下: HTTOP
+    13,  # 上+下+左: HTTOPLEFT
+    14,  # 上+下+右: HTTOPRIGHT
+    13,  # 上+下+左+右: HTTOPLEFT
+)
+
+
 class MainWindow(QMainWindow):
     """主窗口 - MVVM架构.
 
@@ -48,15 +104,36 @@ class MainWindow(QMainWindow):
         :param container: 服务容器实例
         :type container: ServiceContainer
         """
-        logger.trace(f"")
         super().__init__()
 
+        # WM_NCHITTEST 使用的窗口原点和右、下边缘阈值，窗口移动或缩放时更新
+        self._origin_x = 0
+        self._origin_y = 0
+        self._edge_right = 0
+        self._edge_bottom = 0
+
+        # 窗口样式变更是否已通知系统（首次显示时通知）
+        self._frame_notified = False
+
+        # WM_NCCALCSIZE 查询显示器工作区域时复用的 MONITORINFO
+        self._monitor_info = _MONITORINFO()
+        self._monitor_info.cbSize = ctypes.sizeof(_MONITORINFO)
+
         # 保存服务容器
         self._container = container
 
         # 标签页编号计数器（只增不减，创建时分配）
         self._next_tab_number = 1
 
+        # 当前已应用到窗口的主题
+        self._applied_theme: Optional[ThemeData] = None
+
+        # 需要跟随主题的标签页（弱引用，关闭标签页时移除）
+        self._themed_widgets: List[weakref.ReferenceType] = []
+
+        # 主题切换时不可见、尚未应用新主题的标签页，切换到该标签页时再应用
+        self._theme_pending: "weakref.WeakSet[QWidget]" = weakref.WeakSet()
+
         # 创建 ThemeViewModel
         self._theme_vm = ThemeViewModel(
             theme_service=container.theme,
@@ -80,8 +157,6 @@ class MainWindow(QMainWindow):
         创建窗口的主要界面元素：侧边栏 + 标题栏 + 标签页。
         无边框窗口，自定义标题栏在右侧顶部。
         """
-        logger.trace(f"")
-
         # 去掉系统标题栏
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         self.setWindowTitle(APP_TITLE)
@@ -114,6 +189,7 @@ class MainWindow(QMainWindow):
         self.tabs = QStackedWidget()
         self.tabs.setObjectName("contentStack")
         content_layout.addWidget(self.tabs)
+        self.tabs.currentChanged.connect(self._on_current_tab_changed)
 
         # 连接标题栏 tab_bar 信号
         self.title_bar.tab_bar.currentChanged.connect(self.tabs.setCurrentIndex)
@@ -123,7 +199,7 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(content_widget)
 
         # 添加 Win32 原生窗口样式，启用边缘缩放和 Aero Snap
-        self._setup_native_frame()
+        self._apply_window_style()
 
     def _connect_signals(self):
         """连接侧边栏和标题栏信号."""
@@ -143,44 +219,64 @@ class MainWindow(QMainWindow):
         self.title_bar.add_tab_clicked.connect(self._on_add_tab_btn_clicked)
 
         # 主题变更信号 → 全局应用
-        self._theme_vm.theme_changed.connect(self._apply_theme)
+        # 主题切换只在界面线程中发生，直接调用槽函数，省去每次发射时的线程判断
+        self._theme_vm.theme_changed.connect(self._apply_theme, Qt.ConnectionType.DirectConnection)
 
     # ===== 主题 =====
 
+    @Slot()
     def _on_theme_clicked(self):
         """主题切换按钮点击处理."""
         logger.debug("主题切换按钮点击")
         self._theme_vm.toggle_theme()
 
+    @Slot(object)
     def _apply_theme(self, theme: ThemeData):
         """应用主题到整个窗口.
 
         :param theme: 主题数据
         :type theme: ThemeData
         """
-        logger.debug(f"应用主题: {theme.name}")
-
-        # 1. 全局 QSS
-        self.setStyleSheet(AppStyles.main_window(theme))
-
-        # 2. 自绘组件
-        self.title_bar.apply_theme(theme)
-        self.sidebar.apply_theme(theme)
-        self._add_tab_menu.apply_theme(theme)
-
-        # 3. 所有已打开的标签页
-        for i in range(self.tabs.count()):
-            widget = self.tabs.widget(i)
-            if hasattr(widget, 'apply_theme'):
-                widget.apply_theme(theme)
+        # 重新设置相同的样式表也会让 Qt 重新解析 QSS 并刷新所有子控件，主题未变化时直接跳过
+        if theme is self._applied_theme:
+            return
+        self._applied_theme = theme
+        logger.debug("应用主题: {}", theme.name)
+
+        # 暂停重绘，所有样式更新完成后只刷新一次
+        self.setUpdatesEnabled(False)
+        try:
+            # 1. 全局 QSS（侧边栏、标题栏的 QSS 由各自的 apply_theme 设置）
+            self.setStyleSheet(AppStyles.main_window(theme))
+            self.tabs.setStyleSheet(AppStyles.content_stack(theme))
+
+            # 2. 自绘组件
+            self.title_bar.apply_theme(theme)
+            self.sidebar.apply_theme(theme)
+            self._add_tab_menu.apply_theme(theme)
+
+            # 3. 当前标签页立即应用，其余标签页在切换到时再应用
+            current = self.tabs.currentWidget()
+            for ref in self._themed_widgets:
+                widget = ref()
+                if widget is None:
+                    continue
+                if widget is current:
+                    widget.apply_theme(theme)
+                else:
+                    self._theme_pending.add(widget)
+        finally:
+            self.setUpdatesEnabled(True)
 
     # ===== 侧边栏事件 =====
 
+    @Slot()
     def _on_menu_clicked(self):
         """菜单按钮点击处理."""
         logger.debug("菜单按钮点击")
         # TODO: 显示菜单面板
 
+    @Slot()
     def _on_add_clicked(self):
         """添加按钮点击处理 - 弹出添加标签页菜单."""
         logger.debug("添加按钮点击")
@@ -189,6 +285,7 @@ class MainWindow(QMainWindow):
         pos = btn.mapToGlobal(btn.rect().topRight())
         self._add_tab_menu.show(pos)
 
+    @Slot()
     def _on_add_tab_btn_clicked(self):
         """标题栏 '+' 按钮点击处理 - 弹出添加标签页菜单."""
         logger.debug("标题栏添加按钮点击")
@@ -196,51 +293,76 @@ class MainWindow(QMainWindow):
         pos = btn.mapToGlobal(btn.rect().bottomLeft())
         self._add_tab_menu.show(pos)
 
+    @Slot(str)
     def _create_tab(self, tab_type: str):
         """根据类型创建并添加标签页.
 
         :param tab_type: 标签页类型标识
         """
+        # 标签页模块在首次创建标签页时才导入，不占用启动时间
+        from .tabs import PlaceholderTab
+
         tab_name = AddTabMenu.TAB_TYPES.get(tab_type, tab_type)
-        tab = PlaceholderTab(tab_name)
-        # 对新标签页应用当前主题
-        tab.apply_theme(self._theme_vm.current_theme)
-        index = self.tabs.addWidget(tab)
-        self.title_bar.tab_bar.addTab(tab_name)
         icon_name = AddTabMenu.TAB_ICONS.get(tab_type, "file-text")
-        number = self._next_tab_number
-        self._next_tab_number += 1
-        self.title_bar.tab_bar.setTabData(index, {"type": tab_type, "icon": icon_name, "number": number})
-        self.title_bar.tab_bar.setCurrentIndex(index)
-        logger.info(f"已添加标签页: {tab_name}")
+        self._add_tabs([(PlaceholderTab(tab_name), tab_name, tab_type, icon_name)])
+        logger.info("已添加标签页: {}", tab_name)
+
+    def _add_tabs(self, specs: List[Tuple[QWidget, str, str, str]]):
+        """批量添加标签页，并切换到最后添加的标签页.
 
+        添加期间暂停标题栏和内容区的重绘，全部添加完成后只刷新一次。
+
+        :param specs: (标签页控件, 标题, 类型标识, 图标名称) 列表
+        :type specs: List[Tuple[QWidget, str, str, str]]
+        """
+        if not specs:
+            return
+
+        theme = self._theme_vm.current_theme
+        tab_bar = self.title_bar.tab_bar
+        self.title_bar.setUpdatesEnabled(False)
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            for widget, title, tab_type, icon_name in specs:
+                # 对新标签页应用当前主题
+                widget.apply_theme(theme)
+                index = self.tabs.addWidget(widget)
+                self._themed_widgets.append(weakref.ref(widget))
+                tab_bar.addTab(title)
+                tab_bar.setTabData(index, {"type": tab_type, "icon": icon_name, "number": self._next_tab_number})
+                self._next_tab_number += 1
+            tab_bar.setCurrentIndex(index)
+        finally:
+            self.tabs.setUpdatesEnabled(True)
+            self.title_bar.setUpdatesEnabled(True)
+
+    @Slot()
     def _on_bookmark_clicked(self):
         """收藏按钮点击处理."""
         logger.debug("收藏按钮点击")
         # TODO: 显示收藏面板
 
+    @Slot()
     def _on_settings_clicked(self):
         """设置按钮点击处理."""
         logger.debug("设置按钮点击")
         # TODO: 显示设置面板
 
+    @Slot()
     def _on_log_clicked(self):
         """日志按钮点击处理 - 创建新的日志标签页."""
         logger.debug("日志按钮点击")
-        log_tab = LogTab()
-        # 对新标签页应用当前主题
-        log_tab.apply_theme(self._theme_vm.current_theme)
-        index = self.tabs.addWidget(log_tab)
-        self.title_bar.tab_bar.addTab("日志")
-        self.title_bar.tab_bar.setTabData(index, {"type": "log", "icon": "file-text", "number": self._next_tab_number})
-        self._next_tab_number += 1
-        self.title_bar.tab_bar.setCurrentIndex(index)
+        from .tabs import LogTab
+
+        self._add_tabs([(LogTab(), "日志", "log", "file-text")])
 
+    @Slot()
     def _on_about_clicked(self):
         """关于按钮点击处理."""
         logger.debug("关于按钮点击")
         self.show_about()
 
+    @Slot(int)
     def _on_tab_close_requested(self, index: int):
         """标签页关闭请求处理.
 
@@ -249,9 +371,27 @@ class MainWindow(QMainWindow):
         widget = self.tabs.widget(index)
         if widget:
             self.tabs.removeWidget(widget)
+            self._theme_pending.discard(widget)
             widget.deleteLater()
+        # deleteLater 之后 Python 包装对象可能仍然存活，显式移除已关闭的标签页和已失效的引用
+        self._themed_widgets[:] = [
+            ref for ref in self._themed_widgets
+            if ref() is not None and ref() is not widget
+        ]
         self.title_bar.tab_bar.removeTab(index)
 
+    @Slot(int)
+    def _on_current_tab_changed(self, index: int):
+        """切换标签页时，为主题切换期间不可见的标签页补应用当前主题.
+
+        :param index: 当前标签页索引
+        """
+        widget = self.tabs.widget(index)
+        if widget is not None and widget in self._theme_pending:
+            self._theme_pending.discard(widget)
+            widget.apply_theme(self._applied_theme)
+
+    @Slot(int, int)
     def _on_tab_moved(self, from_index: int, to_index: int):
         """标签页拖拽排序后，同步 QStackedWidget 中的 widget 顺序.
 
@@ -269,7 +409,6 @@ class MainWindow(QMainWindow):
 
         弹出对话框显示程序版本和架构信息。
         """
-        logger.trace(f"")
         QMessageBox.about(
             self,
             "关于",
@@ -282,33 +421,66 @@ class MainWindow(QMainWindow):
 
     EDGE_SIZE = 8  # 边缘检测区域像素
 
-    def _setup_native_frame(self):
+    def _apply_window_style(self):
         """添加 Win32 原生窗口样式，启用边缘缩放和 Aero Snap.
 
         FramelessWindowHint 去掉了系统标题栏，但同时也去掉了 WS_THICKFRAME，
         导致系统不处理边缘缩放。这里手动加回来，再通过 WM_NCCALCSIZE 阻止
-        系统绘制标题栏和边框。
+        系统绘制标题栏和边框。样式变更在首次显示时由 :meth:`_notify_frame_changed` 通知系统。
         """
+        if _user32 is None:
+            return
         hwnd = int(self.winId())
         GWL_STYLE = -16
         WS_THICKFRAME = 0x00040000
         WS_MINIMIZEBOX = 0x00020000
         WS_MAXIMIZEBOX = 0x00010000
 
-        style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_STYLE)
+        style = _user32.GetWindowLongW(hwnd, GWL_STYLE)
         style |= WS_THICKFRAME | WS_MINIMIZEBOX | WS_MAXIMIZEBOX
-        ctypes.windll.user32.SetWindowLongW(hwnd, GWL_STYLE, style)
+        _user32.SetWindowLongW(hwnd, GWL_STYLE, style)
 
-        # 通知系统窗口样式已变更
+    def _notify_frame_changed(self):
+        """通知系统窗口样式已变更，触发 WM_NCCALCSIZE 重新计算客户区."""
+        if _user32 is None:
+            return
         SWP_FRAMECHANGED = 0x0020
         SWP_NOMOVE = 0x0002
         SWP_NOSIZE = 0x0001
         SWP_NOZORDER = 0x0004
-        ctypes.windll.user32.SetWindowPos(
-            hwnd, 0, 0, 0, 0, 0,
+        _user32.SetWindowPos(
+            int(self.winId()), 0, 0, 0, 0, 0,
             SWP_FRAMECHANGED | SWP_NOMOVE | SWP_NOSIZE | SWP_NOZORDER
         )
 
+    def showEvent(self, event):
+        """首次显示时通知系统窗口样式已变更.
+
+        延迟到子控件和主题都就绪之后，避免构造过程中提前触发一次布局和重绘。
+        """
+        if not self._frame_notified:
+            self._frame_notified = True
+            self._notify_frame_changed()
+        super().showEvent(event)
+
+    def _update_hit_test_cache(self):
+        """更新 WM_NCHITTEST 使用的窗口原点和边缘阈值."""
+        geometry = self.geometry()
+        self._origin_x = geometry.x()
+        self._origin_y = geometry.y()
+        self._edge_right = geometry.width() - self.EDGE_SIZE
+        self._edge_bottom = geometry.height() - self.EDGE_SIZE
+
+    def moveEvent(self, event):
+        """窗口移动时更新边缘检测缓存."""
+        self._update_hit_test_cache()
+        super().moveEvent(event)
+
+    def resizeEvent(self, event):
+        """窗口缩放时更新边缘检测缓存."""
+        self._update_hit_test_cache()
+        super().resizeEvent(event)
+
     def nativeEvent(self, event_type, message):
         """处理 Windows 原生事件.
 
@@ -316,74 +488,45 @@ class MainWindow(QMainWindow):
         - WM_NCHITTEST: 仅处理边缘缩放（标题栏拖拽由 TitleBar.startSystemMove 处理）
         """
         if event_type == b"windows_generic_MSG":
-            msg = ctypes.wintypes.MSG.from_address(int(message))
+            # 窗口每秒收到大量鼠标、绘制等消息，只处理两种消息时才构造完整的 MSG 结构
+            address = int(message)
+            msg_id = ctypes.c_uint.from_address(address + _MSG_MESSAGE_OFFSET).value
+            if msg_id != 0x0083 and msg_id != 0x0084:
+                return super().nativeEvent(event_type, message)
+            msg = ctypes.wintypes.MSG.from_address(address)
 
             # WM_NCCALCSIZE: 客户区占满整个窗口
             if msg.message == 0x0083:
                 if msg.wParam:
                     # 最大化时，调整客户区为显示器工作区域（避免超出屏幕）
                     if self.isMaximized():
-                        class NCCALCSIZE_PARAMS(ctypes.Structure):
-                            _fields_ = [("rgrc", ctypes.wintypes.RECT * 3)]
-
-                        class MONITORINFO(ctypes.Structure):
-                            _fields_ = [
-                                ("cbSize", ctypes.wintypes.DWORD),
-                                ("rcMonitor", ctypes.wintypes.RECT),
-                                ("rcWork", ctypes.wintypes.RECT),
-                                ("dwFlags", ctypes.wintypes.DWORD),
-                            ]
-
-                        params = NCCALCSIZE_PARAMS.from_address(msg.lParam)
-                        monitor = ctypes.windll.user32.MonitorFromWindow(
+                        params = _NCCALCSIZE_PARAMS.from_address(msg.lParam)
+                        monitor = _MonitorFromWindow(
                             msg.hWnd, 2  # MONITOR_DEFAULTTONEAREST
                         )
-                        mi = MONITORINFO()
-                        mi.cbSize = ctypes.sizeof(MONITORINFO)
-                        ctypes.windll.user32.GetMonitorInfoW(monitor, ctypes.byref(mi))
-
-                        params.rgrc[0].left = mi.rcWork.left
-                        params.rgrc[0].top = mi.rcWork.top
-                        params.rgrc[0].right = mi.rcWork.right
-                        params.rgrc[0].bottom = mi.rcWork.bottom
+                        mi = self._monitor_info
+                        _GetMonitorInfoW(monitor, ctypes.byref(mi))
+                        params.rgrc[0] = mi.rcWork
 
                     return True, 0
 
             # WM_NCHITTEST: 仅处理边缘缩放
             if msg.message == 0x0084:
-                x = ctypes.c_short(msg.lParam & 0xFFFF).value
-                y = ctypes.c_short((msg.lParam >> 16) & 0xFFFF).value
-
-                pos = self.mapFromGlobal(QPoint(x, y))
-                w, h = self.width(), self.height()
+                # lParam 低、高 16 位为有符号屏幕坐标（多显示器时可能为负），用整数运算做符号扩展
+                lparam = msg.lParam
+                x = ((lparam & 0xFFFF) ^ 0x8000) - 0x8000
+                y = (((lparam >> 16) & 0xFFFF) ^ 0x8000) - 0x8000
+
+                # 无边框窗口的客户区即整个窗口，全局坐标减去窗口原点即为窗口内坐标
+                px = x - self._origin_x
+                py = y - self._origin_y
                 e = self.EDGE_SIZE
-                px, py = pos.x(), pos.y()
-
-                on_left = px <= e
-                on_right = px >= w - e
-                on_top = py <= e
-                on_bottom = py >= h - e
-
-                if on_top and on_left:
-                    return True, 13     # HTTOPLEFT
-                if on_top and on_right:
-                    return True, 14     # HTTOPRIGHT
-                if on_bottom and on_left:
-                    return True, 16     # HTBOTTOMLEFT
-                if on_bottom and on_right:
-                    return True, 17     # HTBOTTOMRIGHT
-                if on_left:
-                    return True, 10     # HTLEFT
-                if on_right:
-                    return True, 11     # HTRIGHT
-                if on_top:
-                    return True, 12     # HTTOP
-                if on_bottom:
-                    return True, 15     # HTBOTTOM
-
-                # 非边缘区域一律返回 HTCLIENT，
-                # 避免系统将其识别为标题栏触发 Aero Shake 等行为
-                return True, 1          # HTCLIENT
+
+                mask = ((px <= e)
+                        | (px >= self._edge_right) << 1
+                        | (py <= e) << 2
+                        | (py >= self._edge_bottom) << 3)
+                return True, _HIT_TEST_LUT[mask]
 
         return super().nativeEvent(event_type, message)
 
@@ -404,10 +547,28 @@ class MainWindow(QMainWindow):
         :param event: 关闭事件对象
         :type event: QCloseEvent
         """
-        logger.trace(f"")
         logger.info("正在关闭主窗口...")
 
         # 清理 ViewModel
         self._theme_vm.cleanup()
 
+        # 关闭所有标签页：从后往前移除，避免每次移除都让后面的标签页重新排布
+        tab_bar = self.title_bar.tab_bar
+        self.title_bar.setUpdatesEnabled(False)
+        self.tabs.setUpdatesEnabled(False)
+        self.tabs.blockSignals(True)
+        try:
+            for index in range(self.tabs.count() - 1, -1, -1):
+                widget = self.tabs.widget(index)
+                self.tabs.removeWidget(widget)
+                widget.deleteLater()
+                tab_bar.removeTab(index)
+        finally:
+            self.tabs.blockSignals(False)
+            self.tabs.setUpdatesEnabled(True)
+            self.title_bar.setUpdatesEnabled(True)
+        self._themed_widgets.clear()
+        self._theme_pending.clear()
+        clear_icon_cache()
+
         event.accept()
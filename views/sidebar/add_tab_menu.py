@@ -1,12 +1,16 @@
 # views/sidebar/add_tab_menu.py
 """添加标签页菜单 - 点击添加按钮时弹出."""
 
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict
 
 from PySide6.QtWidgets import QMenu
 from PySide6.QtCore import Signal, QObject
+from PySide6.QtGui import QAction, QIcon
 from loguru import logger
 
+from models.theme_data import DARK_THEME
+from resources.icons import get_icon_pixmap
 from views.styles.app_styles import AppStyles
 
 if TYPE_CHECKING:
@@ -26,8 +30,8 @@ class AddTabMenu(QObject):
 
     tab_requested = Signal(str)  # 发送标签页类型标识
 
-    # 标签页类型定义: (类型标识, 显示名称)
-    TAB_TYPES = {
+    # 标签页类型定义: (类型标识, 显示名称)，只读
+    TAB_TYPES = MappingProxyType({
         "tcp_server": "TCP服务端助手",
         "tcp_client": "TCP客户端助手",
         "udp_server": "UDP服务端助手",
@@ -36,10 +40,10 @@ class AddTabMenu(QObject):
         "i2c": "I2C助手",
         "spi": "SPI助手",
         "gpio": "GPIO助手",
-    }
+    })
 
-    # 标签页类型 → 图标名称映射
-    TAB_ICONS = {
+    # 标签页类型 → 图标名称映射，只读
+    TAB_ICONS = MappingProxyType({
         "tcp_server": "cloud-server",
         "tcp_client": "send",
         "udp_server": "cloud-server",
@@ -49,75 +53,71 @@ class AddTabMenu(QObject):
         "spi": "swap",
         "gpio": "toggle",
         "log": "file-text",
-    }
+    })
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._theme = None
+
+        # 菜单只构建一次，每次弹出直接复用
+        self._menu = QMenu()
+        # 标签页类型 → 菜单项，切换主题时更新图标颜色
+        self._actions: Dict[str, QAction] = {}
+
+        # 网络调试助手子菜单
+        self._net_menu = self._menu.addMenu("网络调试助手")
+        for tab_type in ("tcp_server", "tcp_client", "udp_server", "udp_client"):
+            self._add_action(self._net_menu, tab_type)
+
+        self._menu.addSeparator()
+
+        # 其他助手
+        for tab_type in ("serial", "i2c", "spi", "gpio"):
+            self._add_action(self._menu, tab_type)
+
+        # 应用主题前使用默认的深色主题
+        self.apply_theme(DARK_THEME)
+
+    def _add_action(self, menu: QMenu, tab_type: str):
+        """向菜单添加标签页类型对应的菜单项.
+
+        :param menu: 目标菜单
+        :type menu: QMenu
+        :param tab_type: 标签页类型标识
+        :type tab_type: str
+        """
+        action = menu.addAction(self.TAB_TYPES[tab_type])
+        action.setData(tab_type)
+        self._actions[tab_type] = action
+
+    def _set_style(self, style: str):
+        """设置菜单及子菜单的样式表.
+
+        :param style: QSS 样式表
+        :type style: str
+        """
+        self._menu.setStyleSheet(style)
+        self._net_menu.setStyleSheet(style)
 
     def apply_theme(self, theme: "ThemeData"):
-        """保存当前主题，供下次弹出菜单时使用.
+        """应用主题到菜单.
 
         :param theme: 主题数据
         :type theme: ThemeData
         """
-        self._theme = theme
+        self._set_style(AppStyles.menu_style(theme))
+
+        # 菜单项图标使用菜单文字颜色，位图与侧边栏共用同一缓存
+        ratio = self._menu.devicePixelRatioF()
+        for tab_type, action in self._actions.items():
+            action.setIcon(QIcon(get_icon_pixmap(self.TAB_ICONS[tab_type], theme.menu_text, 16, ratio)))
 
     def show(self, pos):
         """在指定位置显示菜单.
 
         :param pos: 全局坐标位置
         """
-        menu = QMenu()
-
-        if self._theme:
-            style = AppStyles.menu_style(self._theme)
-        else:
-            # 回退默认样式
-            style = """
-                QMenu {
-                    background-color: #2b2b2b;
-                    color: #cccccc;
-                    border: 1px solid #3c3c3c;
-                    padding: 4px 0;
-                }
-                QMenu::item {
-                    padding: 6px 24px;
-                }
-                QMenu::item:selected {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                }
-                QMenu::separator {
-                    height: 1px;
-                    background: #3c3c3c;
-                    margin: 4px 8px;
-                }
-                QMenu::item:disabled {
-                    color: #888888;
-                    font-weight: bold;
-                }
-            """
-        menu.setStyleSheet(style)
-
-        # 网络调试助手子菜单
-        net_menu = menu.addMenu("网络调试助手")
-        net_menu.setStyleSheet(style)
-
-        for tab_type in ("tcp_server", "tcp_client", "udp_server", "udp_client"):
-            action = net_menu.addAction(self.TAB_TYPES[tab_type])
-            action.setData(tab_type)
-
-        menu.addSeparator()
-
-        # 其他助手
-        for tab_type in ("serial", "i2c", "spi", "gpio"):
-            action = menu.addAction(self.TAB_TYPES[tab_type])
-            action.setData(tab_type)
-
-        # 处理选择
-        action = menu.exec(pos)
+        action = self._menu.exec(pos)
         if action and action.data():
             tab_type = action.data()
-            logger.info(f"用户请求添加标签页: {self.TAB_TYPES.get(tab_type, tab_type)}")
+            logger.info("用户请求添加标签页: {}", self.TAB_TYPES.get(tab_type, tab_type))
             self.tab_requested.emit(tab_type)
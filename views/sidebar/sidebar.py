@@ -3,10 +3,11 @@
 
 from typing import TYPE_CHECKING
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QSpacerItem, QSizePolicy
+from PySide6.QtWidgets import QWidget, QVBoxLayout
 from PySide6.QtCore import Signal
 from loguru import logger
 
+from views.styles.app_styles import AppStyles
 from .sidebar_button import SidebarButton
 
 if TYPE_CHECKING:
@@ -59,40 +60,40 @@ class Sidebar(QWidget):
 
         # 菜单按钮 - electerm 使用 logo，这里用汉堡菜单图标
         self.btn_menu = SidebarButton("menu", "菜单")
-        self.btn_menu.clicked.connect(self.menu_clicked.emit)
+        self.btn_menu.clicked.connect(self.menu_clicked)
         layout.addWidget(self.btn_menu)
 
         # 添加按钮 - PlusCircleOutlined
         self.btn_add = SidebarButton("plus-circle", "添加")
-        self.btn_add.clicked.connect(self.add_clicked.emit)
+        self.btn_add.clicked.connect(self.add_clicked)
         layout.addWidget(self.btn_add)
 
         # 收藏按钮 - BookOutlined
         self.btn_bookmark = SidebarButton("book", "收藏")
-        self.btn_bookmark.clicked.connect(self.bookmark_clicked.emit)
+        self.btn_bookmark.clicked.connect(self.bookmark_clicked)
         layout.addWidget(self.btn_bookmark)
 
         # 设置按钮 - SettingOutlined
         self.btn_settings = SidebarButton("setting", "设置")
-        self.btn_settings.clicked.connect(self.settings_clicked.emit)
+        self.btn_settings.clicked.connect(self.settings_clicked)
         layout.addWidget(self.btn_settings)
 
         # 日志按钮 - FileTextOutlined
         self.btn_log = SidebarButton("file-text", "日志")
-        self.btn_log.clicked.connect(self.log_clicked.emit)
+        self.btn_log.clicked.connect(self.log_clicked)
         layout.addWidget(self.btn_log)
 
         # 关于按钮 - InfoCircleOutlined
         self.btn_about = SidebarButton("info-circle", "关于")
-        self.btn_about.clicked.connect(self.about_clicked.emit)
+        self.btn_about.clicked.connect(self.about_clicked)
         layout.addWidget(self.btn_about)
 
         # 弹性空间，将上方按钮推到顶部，下方按钮推到底部
-        layout.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
+        layout.addStretch()
 
         # 主题切换按钮 - BulbOutlined（底部）
         self.btn_theme = SidebarButton("bulb", "切换主题")
-        self.btn_theme.clicked.connect(self.theme_clicked.emit)
+        self.btn_theme.clicked.connect(self.theme_clicked)
         layout.addWidget(self.btn_theme)
 
         logger.trace("侧边栏UI初始化完成")
@@ -103,6 +104,7 @@ class Sidebar(QWidget):
         :param theme: 主题数据
         :type theme: ThemeData
         """
+        self.setStyleSheet(AppStyles.sidebar(theme))
         for btn in (self.btn_menu, self.btn_add, self.btn_bookmark,
                     self.btn_settings, self.btn_log, self.btn_about,
                     self.btn_theme):
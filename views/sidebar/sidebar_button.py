@@ -4,12 +4,10 @@
 from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import QPushButton
-from PySide6.QtCore import Qt, QRectF
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QPainter, QColor
-from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtCore import QByteArray
 
-from resources.icons import ICONS
+from resources.icons import ICONS, get_icon_pixmap
 
 if TYPE_CHECKING:
     from models.theme_data import ThemeData
@@ -56,30 +54,20 @@ class SidebarButton(QPushButton):
         super().leaveEvent(event)
 
     def paintEvent(self, event):
-        """绘制事件 - 绘制 SVG 图标."""
+        """绘制事件 - 绘制缓存的 SVG 图标位图."""
         super().paintEvent(event)
 
         if self._icon_name not in ICONS:
             return
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # 获取 SVG 并替换颜色
-        svg_str = ICONS[self._icon_name]
-        svg_str = svg_str.replace('fill="currentColor"', f'fill="{self._icon_color.name()}"')
-
-        # 渲染 SVG
-        svg_data = QByteArray(svg_str.encode('utf-8'))
-        renderer = QSvgRenderer(svg_data)
-
-        # 居中绘制，图标大小 20x20
+        # 居中绘制，图标大小 20x20，位图按图标名称和颜色缓存
         icon_size = 20
+        pixmap = get_icon_pixmap(self._icon_name, self._icon_color.name(), icon_size, self.devicePixelRatioF())
         x = (self.width() - icon_size) // 2
         y = (self.height() - icon_size) // 2
 
-        renderer.render(painter, QRectF(x, y, icon_size, icon_size))
-
+        painter = QPainter(self)
+        painter.drawPixmap(x, y, pixmap)
         painter.end()
 
     def apply_theme(self, theme: "ThemeData"):
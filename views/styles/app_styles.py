@@ -3,6 +3,7 @@
 此模块定义应用程序中使用的所有样式常量和方法。
 主题相关的样式通过工厂方法生成，接收 ThemeData 参数。
 """
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
 from loguru import logger
@@ -15,7 +16,8 @@ class AppStyles:
     """集中管理应用中的所有样式.
 
     - 状态色（success/danger/warning 等）不随主题变化，保留为类常量
-    - 主窗口全局样式、菜单样式等通过静态工厂方法生成
+    - 主窗口全局样式、菜单样式等通过静态工厂方法生成；
+      ThemeData 不可变，同一主题生成的样式表会被缓存，切换主题时直接复用
     """
 
     # ===== 状态色常量（不随主题变化） =====
@@ -235,9 +237,13 @@ class AppStyles:
     # ═══════════════════════════════════════════
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def main_window(t: "ThemeData") -> str:
         """生成主窗口全局样式表.
 
+        只包含窗口背景和通用控件样式；侧边栏、标题栏、内容区的样式
+        分别设置在各自的控件上，主题切换时样式匹配范围更小。
+
         :param t: 主题数据
         :type t: ThemeData
         :return: QSS 样式字符串
@@ -247,27 +253,6 @@ class AppStyles:
             QMainWindow {{
                 background-color: {t.window_bg};
             }}
-            /* 侧边栏 */
-            #sidebar {{
-                background-color: {t.sidebar_bg};
-                border: none;
-            }}
-            #sidebarButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 0px;
-                min-width: 36px;
-                max-width: 36px;
-                min-height: 36px;
-                max-height: 36px;
-                padding: 0px;
-            }}
-            #sidebarButton:hover {{
-                background-color: {t.sidebar_hover_bg};
-            }}
-            #sidebarButton:pressed {{
-                background-color: {t.sidebar_hover_bg};
-            }}
             /* 通用按钮 */
             QPushButton {{
                 background-color: {t.color_success};
@@ -304,11 +289,53 @@ class AppStyles:
                 background-color: {t.input_bg};
                 color: {t.text_primary};
             }}
-            /* 内容区 */
-            #contentStack {{
-                background-color: {t.content_bg};
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def sidebar(t: "ThemeData") -> str:
+        """生成侧边栏样式表.
+
+        :param t: 主题数据
+        :type t: ThemeData
+        :return: QSS 样式字符串
+        :rtype: str
+        """
+        return f"""
+            /* 侧边栏 */
+            #sidebar {{
+                background-color: {t.sidebar_bg};
                 border: none;
             }}
+            #sidebarButton {{
+                background-color: transparent;
+                border: none;
+                border-radius: 0px;
+                min-width: 36px;
+                max-width: 36px;
+                min-height: 36px;
+                max-height: 36px;
+                padding: 0px;
+            }}
+            #sidebarButton:hover {{
+                background-color: {t.sidebar_hover_bg};
+            }}
+            #sidebarButton:pressed {{
+                background-color: {t.sidebar_hover_bg};
+            }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def title_bar(t: "ThemeData") -> str:
+        """生成标题栏样式表（标签导航按钮、窗口控制按钮）.
+
+        :param t: 主题数据
+        :type t: ThemeData
+        :return: QSS 样式字符串
+        :rtype: str
+        """
+        return f"""
             /* 标题栏 "+" 添加按钮 */
             #addTabButton {{
                 background-color: transparent;
@@ -383,6 +410,25 @@ class AppStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=8)
+    def content_stack(t: "ThemeData") -> str:
+        """生成内容区样式表.
+
+        :param t: 主题数据
+        :type t: ThemeData
+        :return: QSS 样式字符串
+        :rtype: str
+        """
+        return f"""
+            /* 内容区 */
+            #contentStack {{
+                background-color: {t.content_bg};
+                border: none;
+            }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=8)
     def menu_style(t: "ThemeData") -> str:
         """生成菜单样式表.
 
@@ -417,6 +463,7 @@ class AppStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def log_text_edit(t: "ThemeData") -> str:
         """生成日志文本框样式.
 
@@ -434,6 +481,7 @@ class AppStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def label_status(t: "ThemeData") -> str:
         """生成状态标签样式.
 
@@ -454,6 +502,7 @@ class AppStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def label_title(t: "ThemeData") -> str:
         """生成标题标签样式.
 
@@ -472,6 +521,7 @@ class AppStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def label_value(t: "ThemeData") -> str:
         """生成值标签样式.
 
@@ -492,6 +542,7 @@ class AppStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def line_edit(t: "ThemeData") -> str:
         """生成输入框样式.
 
@@ -519,6 +570,7 @@ class AppStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def table_widget(t: "ThemeData") -> str:
         """生成表格样式.
 
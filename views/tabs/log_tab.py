@@ -16,7 +16,6 @@ class LogTab(QWidget):
     """
 
     def __init__(self):
-        logger.trace(f"")
         super().__init__()
 
         self.init_ui()
@@ -28,7 +27,6 @@ class LogTab(QWidget):
 
         创建日志显示组件并配置显示选项。
         """
-        logger.trace(f"")
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
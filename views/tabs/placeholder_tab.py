@@ -25,7 +25,7 @@ class PlaceholderTab(QWidget):
         self._title = title
         self._description = description or f"{title} - 功能开发中"
         self._init_ui()
-        logger.info(f"标签页已创建: {title}")
+        logger.info("标签页已创建: {}", title)
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
@@ -228,13 +228,13 @@ class LogWidget(QWidget):
                 logger.trace("没有找到历史日志")
                 return
 
-            logger.trace(f"正在加载 {len(history_logs)} 条历史日志")
+            logger.trace("正在加载 {} 条历史日志", len(history_logs))
 
             # 逐条显示历史日志
             for log_data in history_logs:
                 # 格式化日志消息
                 formatted_msg = self._format_log_from_data(log_data)
-                level = log_data.get("level", "INFO")
+                level = log_data.level or "INFO"
 
                 # 保存到日志列表（用于重新过滤）
                 self.all_logs.append({
@@ -265,40 +265,38 @@ class LogWidget(QWidget):
             self.log_text.setTextCursor(cursor)
             self.log_text.ensureCursorVisible()
 
-            logger.trace(f"成功加载 {len(history_logs)} 条历史日志")
+            logger.trace("成功加载 {} 条历史日志", len(history_logs))
 
         except ImportError:
             logger.trace("HansLoguruUI 不可用，跳过加载历史日志")
         except Exception as e:
             logger.opt(exception=e).warning("加载历史日志失败")
 
-    def _format_log_from_data(self, log_data: dict) -> str:
+    def _format_log_from_data(self, log_data) -> str:
         """根据日志数据格式化日志消息.
 
-        :param log_data: 日志数据字典
-        :type log_data: dict
+        :param log_data: 日志记录
+        :type log_data: LogRecord
         :return: 格式化后的日志字符串
         :rtype: str
         """
         try:
-            time_str = log_data.get("time", "")
-            level = log_data.get("level", "INFO")
-            process = log_data.get("process", "")
-            thread = log_data.get("thread", "")
-            file = log_data.get("file", "")
-            name = log_data.get("name", "")
-            function = log_data.get("function", "")
-            line = log_data.get("line", "")
-            message = log_data.get("message", "")
-
-            # 格式化时间
-            if time_str:
-                # ISO格式转换为可读格式
-                try:
-                    dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                    time_formatted = dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-                except:
-                    time_formatted = time_str
+            time_ns = log_data.time
+            level = log_data.level or "INFO"
+            process = log_data.process
+            thread = log_data.thread
+            file = log_data.file
+            name = log_data.name
+            function = log_data.function
+            line = log_data.line
+            message = log_data.message
+
+            # 格式化时间（纳秒时间戳转换为本地时间）
+            if time_ns:
+                dt = datetime.fromtimestamp(time_ns // 1_000_000_000).replace(
+                    microsecond=time_ns % 1_000_000_000 // 1000
+                )
+                time_formatted = dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
             else:
                 time_formatted = ""
 
@@ -431,7 +429,7 @@ class LogWidget(QWidget):
         :type level: str
         """
         self.current_filter_level = level
-        logger.debug(f"GUI日志显示级别已设置为: {level}")
+        logger.debug("GUI日志显示级别已设置为: {}", level)
         # 重新渲染所有日志
         self._refresh_logs()
 
@@ -12,12 +12,11 @@
 from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QApplication, QTabBar
-from PySide6.QtCore import Qt, QRectF, Signal, QSize, QRect
+from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QSize, QRect
 from PySide6.QtGui import QPainter, QColor, QMouseEvent, QPalette, QPen
-from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtCore import QByteArray
 
-from resources.icons import ICONS
+from resources.icons import ICONS, get_icon_pixmap
+from views.styles.app_styles import AppStyles
 
 if TYPE_CHECKING:
     from models.theme_data import ThemeData
@@ -57,20 +56,13 @@ class TitleBarButton(QPushButton):
         if self._icon_name not in ICONS:
             return
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        svg_str = ICONS[self._icon_name]
-        svg_str = svg_str.replace('fill="currentColor"', f'fill="{self._icon_color.name()}"')
-
-        svg_data = QByteArray(svg_str.encode('utf-8'))
-        renderer = QSvgRenderer(svg_data)
-
         icon_size = 14
+        pixmap = get_icon_pixmap(self._icon_name, self._icon_color.name(), icon_size, self.devicePixelRatioF())
         x = (self.width() - icon_size) // 2
         y = (self.height() - icon_size) // 2
-        renderer.render(painter, QRectF(x, y, icon_size, icon_size))
 
+        painter = QPainter(self)
+        painter.drawPixmap(x, y, pixmap)
         painter.end()
 
     def set_icon_name(self, icon_name: str):
@@ -285,13 +277,8 @@ class TitleTabBar(QTabBar):
             icon_size = 14
             icon_y = rect.y() + (rect.height() - icon_size) // 2
 
-            svg_str = ICONS[icon_name]
-            svg_str = svg_str.replace(
-                'fill="currentColor"', f'fill="{text_color.name()}"'
-            )
-            svg_data = QByteArray(svg_str.encode('utf-8'))
-            renderer = QSvgRenderer(svg_data)
-            renderer.render(painter, QRectF(cursor_x, icon_y, icon_size, icon_size))
+            pixmap = get_icon_pixmap(icon_name, text_color.name(), icon_size, self.devicePixelRatioF())
+            painter.drawPixmap(QPointF(cursor_x, icon_y), pixmap)
 
             cursor_x += icon_size + 4
 
@@ -570,7 +557,7 @@ class TitleBar(QWidget):
 
         # "+" 添加按钮
         self._btn_add = AddTabButton(self)
-        self._btn_add.clicked.connect(self.add_tab_clicked.emit)
+        self._btn_add.clicked.connect(self.add_tab_clicked)
         layout.addWidget(self._btn_add)
 
         # 弹性空间
@@ -614,6 +601,7 @@ class TitleBar(QWidget):
         :type theme: ThemeData
         """
         self._current_theme = theme
+        self.setStyleSheet(AppStyles.title_bar(theme))
         self.tab_bar.apply_theme(theme)
         self._btn_add.apply_theme(theme)
         self._btn_scroll_left.apply_theme(theme)
@@ -667,7 +655,6 @@ class TitleBar(QWidget):
     def _show_tab_list(self):
         """显示所有标签页的下拉列表."""
         from PySide6.QtWidgets import QMenu
-        from views.styles.app_styles import AppStyles
 
         menu = QMenu(self)
 